@@ -0,0 +1,508 @@
+"""The AdzeKit Settings model.
+
+Kept apart from adzekit.config so that importing the config helpers does
+not import pydantic; adzekit.config re-exports ``Settings`` lazily.
+"""
+
+import functools
+import os
+import shutil
+import subprocess
+from pathlib import Path
+
+from pydantic import Field, model_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from adzekit.config import (
+    _GITIGNORE_ENTRIES,
+    _MARKER_FIELD_ENV,
+    _MARKER_INT_DEFAULTS,
+    BACKBONE_VERSION,
+    MARKER_FILE,
+    ShedNotInitializedError,
+    _ensured_sheds,
+    _parse_kv_file,
+    _write_kv_file,
+)
+
+
+class Settings(BaseSettings):
+    """AdzeKit application settings."""
+
+    model_config = SettingsConfigDict(
+        env_prefix="ADZEKIT_",
+        extra="ignore",
+        populate_by_name=True,
+    )
+
+    shed: Path = Field(
+        default=Path.home() / "adzekit",
+        description="Root directory of the AdzeKit shed.",
+    )
+
+    git_repo: str = Field(
+        default="",
+        description="Git remote URL for the shed repo.",
+    )
+    git_branch: str = Field(
+        default="main",
+        description="Branch to use when syncing with the git remote.",
+    )
+
+    rclone_remote: str = Field(
+        default="",
+        description=(
+            "rclone remote base path, e.g. 'gdrive:adzekit'. "
+            "stock/ and drafts/ are synced as subdirectories under this path."
+        ),
+    )
+
+    agent_backend: str = Field(
+        default="isaac",
+        description="Agent backend for the web UI chat (isaac via dbexec).",
+    )
+
+    agent_timeout: int = Field(
+        default=600,
+        description=(
+            "Seconds to wait for an Isaac response before timing out. "
+            "Set via ADZEKIT_AGENT_TIMEOUT or agent_timeout in .adzekit."
+        ),
+    )
+
+    @model_validator(mode="after")
+    def _load_shed_config(self) -> "Settings":
+        """Load connection settings from the shed's .adzekit config file.
+
+        Environment variables take precedence. For fields still at their
+        default and not set via an env var, values from .adzekit are used.
+        """
+        pending = [name for name, env in _MARKER_FIELD_ENV.items() if env not in os.environ]
+        if not pending:
+            return self
+        # A missing marker parses as empty, so no separate is_file() check.
+        config = _parse_kv_file(self.shed / MARKER_FILE)
+        if not config:
+            return self
+
+        for field_name in pending:
+            val = config.get(field_name)
+            if not val:
+                continue
+            default = _FIELD_DEFAULTS[field_name]
+            if getattr(self, field_name) == default:
+                # Cast to the same type as the default to avoid str/int mismatches
+                try:
+                    typed_val = type(default)(val) if default is not None else val
+                except (ValueError, TypeError):
+                    typed_val = val
+                object.__setattr__(self, field_name, typed_val)
+
+        return self
+
+    # --- Derived shed paths (v1 backbone), built once per instance ---
+
+    @functools.cached_property
+    def loops_dir(self) -> Path:
+        return self.shed / "loops"
+
+    @functools.cached_property
+    def loops_active(self) -> Path:
+        return self.loops_dir / "active.md"
+
+    @functools.cached_property
+    def loops_backlog(self) -> Path:
+        return self.loops_dir / "backlog.md"
+
+    @functools.cached_property
+    def loops_archive(self) -> Path:
+        return self.loops_dir / "archive.md"
+
+    @functools.cached_property
+    def loops_archive_dir(self) -> Path:
+        return self.loops_dir / "archive"
+
+    @functools.cached_property
+    def projects_dir(self) -> Path:
+        return self.shed / "projects"
+
+    @functools.cached_property
+    def active_dir(self) -> Path:
+        return self.projects_dir
+
+    @functools.cached_property
+    def backlog_dir(self) -> Path:
+        return self.projects_dir / "backlog"
+
+    @functools.cached_property
+    def archive_dir(self) -> Path:
+        return self.projects_dir / "archive"
+
+    @functools.cached_property
+    def daily_dir(self) -> Path:
+        return self.shed / "daily"
+
+    @functools.cached_property
+    def knowledge_dir(self) -> Path:
+        return self.shed / "knowledge"
+
+    @functools.cached_property
+    def reviews_dir(self) -> Path:
+        return self.shed / "reviews"
+
+    @functools.cached_property
+    def bench_path(self) -> Path:
+        return self.shed / "bench.md"
+
+    @functools.cached_property
+    def stock_dir(self) -> Path:
+        return self.shed / "stock"
+
+    @functools.cached_property
+    def drafts_dir(self) -> Path:
+        return self.shed / "drafts"
+
+    @functools.cached_property
+    def graph_dir(self) -> Path:
+        return self.shed / "graph"
+
+    @functools.cached_property
+    def marker_path(self) -> Path:
+        return self.shed / MARKER_FILE
+
+    @property
+    def is_initialized(self) -> bool:
+        """True if this shed has a .adzekit marker file."""
+        return self.marker_path.exists()
+
+    def _read_marker(self) -> dict[str, str]:
+        """Parse the .adzekit config file into a key-value dict."""
+        return _parse_kv_file(self.marker_path)
+
+    @property
+    def _marker_values(self) -> dict[str, int | None]:
+        """Typed snapshot of the marker's numeric settings.
+
+        Re-parsed only when the marker's (mtime_ns, size, inode) changes, so
+        a long-lived instance still sees edits made by another process.
+        """
+        try:
+            st = os.stat(self.marker_path)
+            stamp = (st.st_mtime_ns, st.st_size, st.st_ino)
+        except FileNotFoundError:
+            stamp = None
+        snapshot = self.__dict__.get("_marker_snapshot")
+        if snapshot is not None and snapshot[0] == stamp:
+            return snapshot[1]
+
+        raw = self._read_marker()
+        try:
+            backbone = int(raw["backbone_version"])
+        except (KeyError, ValueError):
+            backbone = None
+        values: dict[str, int | None] = {"backbone_version": backbone}
+        for key, default in _MARKER_INT_DEFAULTS.items():
+            val = raw.get(key)
+            values[key] = int(val) if val else default
+        self.__dict__["_marker_snapshot"] = (stamp, values)
+        return values
+
+    @property
+    def shed_backbone_version(self) -> int | None:
+        """Read the backbone version from the .adzekit marker, or None."""
+        return self._marker_values["backbone_version"]
+
+    @property
+    def max_active_projects(self) -> int:
+        return self._marker_values["max_active_projects"]
+
+    @property
+    def max_daily_tasks(self) -> int:
+        return self._marker_values["max_daily_tasks"]
+
+    @property
+    def loop_sla_hours(self) -> int:
+        return self._marker_values["loop_sla_hours"]
+
+    @property
+    def stale_loop_days(self) -> int:
+        return self._marker_values["stale_loop_days"]
+
+    @property
+    def stale_draft_days(self) -> int:
+        return self._marker_values["stale_draft_days"]
+
+    def require_initialized(self) -> None:
+        """Raise ShedNotInitializedError if this shed has no .adzekit marker."""
+        if not self.is_initialized:
+            raise ShedNotInitializedError(self.shed)
+
+    def write_marker(self) -> None:
+        """Write the .adzekit config file.
+
+        Preserves any existing user-configured values and fills in
+        defaults for keys that don't exist yet.
+        """
+        self.shed.mkdir(parents=True, exist_ok=True)
+        existing = self._read_marker()
+
+        data = {"backbone_version": str(BACKBONE_VERSION)}
+        for key, default in _MARKER_INT_DEFAULTS.items():
+            data[key] = existing.get(key, str(default))
+
+        # Connection settings -- only written when they have a value.
+        rclone = existing.get("rclone_remote", "") or self.rclone_remote
+        git = existing.get("git_repo", "") or self.git_repo
+        git_br = existing.get("git_branch", "") or self.git_branch
+
+        if rclone:
+            data["rclone_remote"] = rclone
+        if git:
+            data["git_repo"] = git
+            data["git_branch"] = git_br
+
+        self._rewrite_marker(data)
+
+    def set_config(self, key: str, value: str) -> None:
+        """Set a single key in the .adzekit config file."""
+        existing = self._read_marker()
+        existing[key] = value
+        self._rewrite_marker(existing)
+
+    def _rewrite_marker(self, data: dict[str, str]) -> None:
+        """Replace the marker with ``data`` and refresh the cached copies."""
+        _write_kv_file(self.marker_path, data)
+        self.__dict__.pop("_marker_snapshot", None)
+
+    @property
+    def has_rclone_remote(self) -> bool:
+        return bool(self.rclone_remote)
+
+    @property
+    def rclone_stock_remote(self) -> str:
+        """Remote path for stock/, e.g. 'gdrive:adzekit/stock'."""
+        return f"{self.rclone_remote.rstrip('/')}/stock"
+
+    @property
+    def rclone_drafts_remote(self) -> str:
+        """Remote path for drafts/, e.g. 'gdrive:adzekit/drafts'."""
+        return f"{self.rclone_remote.rstrip('/')}/drafts"
+
+    @property
+    def is_git_backed(self) -> bool:
+        return bool(self.git_repo)
+
+    def ensure_shed(self) -> None:
+        """Create the full shed directory tree.
+
+        Runs once per shed per process; later calls only check that the
+        shed root still exists.
+        """
+        if self.shed in _ensured_sheds and os.path.isdir(self.shed):
+            return
+
+        # Leaves only: makedirs creates loops/ and projects/ on the way.
+        for d in (
+            self.loops_archive_dir,
+            self.backlog_dir,
+            self.archive_dir,
+            self.daily_dir,
+            self.knowledge_dir,
+            self.reviews_dir,
+            self.graph_dir,
+            self.stock_dir,
+            self.drafts_dir,
+        ):
+            os.makedirs(d, exist_ok=True)
+
+        for f in (self.loops_active, self.loops_backlog, self.bench_path):
+            try:
+                os.close(os.open(f, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644))
+            except FileExistsError:
+                pass
+
+        # Keep stock/ and drafts/ out of git. Missing entries are
+        # appended, never rewritten.
+        gitignore = self.shed / ".gitignore"
+        present: set[str] = set()
+        ends_with_newline = True
+        try:
+            with open(gitignore, encoding="utf-8") as fh:
+                for line in fh:
+                    present.add(line.strip())
+                    ends_with_newline = line.endswith("\n")
+        except FileNotFoundError:
+            pass
+        missing = [e for e in _GITIGNORE_ENTRIES if e not in present]
+        if missing:
+            with open(gitignore, "a", encoding="utf-8") as fh:
+                fh.write(("" if ends_with_newline else "\n") + "\n".join(missing) + "\n")
+        _ensured_sheds.add(self.shed)
+
+    # --- Git operations ---
+
+    def _run_git(
+        self, *args: str, cwd: Path | None = None, capture: bool = False
+    ) -> subprocess.CompletedProcess:
+        """Run git in the shed.
+
+        stdout is captured as text only when ``capture`` is set; otherwise
+        it is discarded. stderr is always kept so CalledProcessError
+        carries git's message.
+        """
+        return subprocess.run(
+            ["git", *args],
+            cwd=cwd or self.shed,
+            stdout=subprocess.PIPE if capture else subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            check=True,
+        )
+
+    def sync_shed(self) -> None:
+        """Clone or pull the shed repo."""
+        if not self.is_git_backed:
+            raise ValueError("git_repo is not configured. Set ADZEKIT_GIT_REPO.")
+
+        root = self.shed
+        if root.exists() and (root / ".git").is_dir():
+            self._run_git("fetch", "origin", self.git_branch)
+            self._run_git("merge", "--ff-only", f"origin/{self.git_branch}")
+        else:
+            root.mkdir(parents=True, exist_ok=True)
+            self._run_git(
+                "clone", "--branch", self.git_branch, self.git_repo, str(root),
+                cwd=root.parent,
+            )
+
+    def commit_shed(self, message: str = "adzekit: sync") -> bool:
+        """Stage, commit, and push. Returns True if a commit was made."""
+        if not self.is_git_backed:
+            raise ValueError("git_repo is not configured. Set ADZEKIT_GIT_REPO.")
+
+        if not self.is_dirty():
+            return False
+
+        self._run_git("add", "-A")
+
+        # Let commit report an empty index itself instead of forking
+        # `git diff --cached --quiet` first. LC_ALL=C keeps the message
+        # we match on untranslated.
+        cmd = ["git", "commit", "-m", message]
+        result = subprocess.run(
+            cmd,
+            cwd=self.shed,
+            capture_output=True,
+            text=True,
+            env={**os.environ, "LC_ALL": "C"},
+        )
+        if result.returncode:
+            if "nothing to commit" in result.stdout:
+                return False
+            raise subprocess.CalledProcessError(
+                result.returncode, cmd, result.stdout, result.stderr
+            )
+
+        self._run_git("push", "origin", self.git_branch)
+        return True
+
+    def is_dirty(self) -> bool:
+        """True if the work tree has changes, including untracked files."""
+        return bool(self._run_git("status", "--porcelain", "-z", capture=True).stdout)
+
+    def shed_git_status(self) -> str:
+        if not self.is_git_backed:
+            return ""
+        if not (self.shed / ".git").is_dir():
+            return ""
+        result = self._run_git("status", "--short", capture=True)
+        return result.stdout
+
+    # --- rclone operations (workbench: stock/ + drafts/) ---
+
+    def _check_rclone(self) -> None:
+        """Raise if rclone is not installed."""
+        if shutil.which("rclone") is None:
+            raise RuntimeError(
+                "rclone is not installed. Install with: brew install rclone"
+            )
+
+    def _require_rclone_remote(self) -> None:
+        if not self.has_rclone_remote:
+            raise ValueError(
+                "rclone_remote is not configured. "
+                "Run 'adzekit setup-sync' or set ADZEKIT_RCLONE_REMOTE."
+            )
+
+    def _rclone_pull(
+        self, remote: str, local: Path, *, additive: bool = False,
+    ) -> None:
+        """Pull from remote to local, tolerating a missing remote dir.
+
+        When *additive* is True, uses ``rclone copy`` so local files that
+        don't exist on the remote are preserved.  Use this for stock/ to
+        avoid data loss when the remote hasn't been pushed yet.
+        """
+        local.mkdir(parents=True, exist_ok=True)
+        verb = "copy" if additive else "sync"
+        result = subprocess.run(
+            ["rclone", verb, remote, str(local), "--create-empty-src-dirs"],
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0:
+            # rclone exits 3 for "directory not found" -- normal on first use
+            if "directory not found" in (result.stderr or ""):
+                return
+            raise subprocess.CalledProcessError(
+                result.returncode,
+                result.args,
+                output=result.stdout,
+                stderr=result.stderr,
+            )
+
+    def _rclone_push(self, local: Path, remote: str) -> None:
+        """Push from local to remote (creates remote dir automatically)."""
+        local.mkdir(parents=True, exist_ok=True)
+        subprocess.run(
+            ["rclone", "sync", str(local), remote, "--create-empty-src-dirs"],
+            check=True,
+        )
+
+    def sync_stock(self) -> None:
+        """Pull stock/ from the rclone remote (additive -- never deletes local files)."""
+        self._require_rclone_remote()
+        self._check_rclone()
+        self._rclone_pull(self.rclone_stock_remote, self.stock_dir, additive=True)
+
+    def push_stock(self) -> None:
+        """Push local stock/ to the rclone remote."""
+        self._require_rclone_remote()
+        self._check_rclone()
+        self._rclone_push(self.stock_dir, self.rclone_stock_remote)
+
+    def sync_drafts(self) -> None:
+        """Pull drafts/ from the rclone remote."""
+        self._require_rclone_remote()
+        self._check_rclone()
+        self._rclone_pull(self.rclone_drafts_remote, self.drafts_dir)
+
+    def push_drafts(self) -> None:
+        """Push local drafts/ to the rclone remote."""
+        self._require_rclone_remote()
+        self._check_rclone()
+        self._rclone_push(self.drafts_dir, self.rclone_drafts_remote)
+
+    def sync_workbench(self) -> None:
+        """Pull both stock/ and drafts/ from the rclone remote."""
+        self.sync_stock()
+        self.sync_drafts()
+
+    def push_workbench(self) -> None:
+        """Push both stock/ and drafts/ to the rclone remote."""
+        self.push_stock()
+        self.push_drafts()
+
+
+# Read by _load_shed_config at validation time, after the class exists.
+_FIELD_DEFAULTS = {name: Settings.model_fields[name].default for name in _MARKER_FIELD_ENV}
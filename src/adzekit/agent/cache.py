@@ -0,0 +1,64 @@
+"""Short-lived result cache for idempotent agent tools.
+
+Within one agent session the LLM often re-reads the same bench or drafts
+listing across turns. Read-only tools without a stat-checked loader are
+wrapped with @cached_tool so repeated calls within the TTL return the
+previous result instead of re-reading the shed. Results are keyed on the
+current shed as well as the arguments, so switching sheds never returns
+another shed's data. Write tools call invalidate() for the readers whose
+output they change.
+"""
+
+import functools
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable
+
+from adzekit.config import get_settings
+
+DEFAULT_TTL = 15.0
+MAX_ENTRIES = 256
+
+_lock = threading.Lock()
+_entries: OrderedDict[tuple, tuple[float, Any]] = OrderedDict()
+
+
+def cached_tool(ttl: float = DEFAULT_TTL) -> Callable:
+    """Cache a tool's result for ``ttl`` seconds, keyed on its arguments."""
+
+    def decorator(fn: Callable) -> Callable:
+        name = fn.__name__
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            key = (name, get_settings().shed, args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            with _lock:
+                hit = _entries.get(key)
+                if hit is not None and hit[0] > now:
+                    _entries.move_to_end(key)
+                    return hit[1]
+
+            result = fn(*args, **kwargs)
+
+            with _lock:
+                _entries[key] = (now + ttl, result)
+                _entries.move_to_end(key)
+                while len(_entries) > MAX_ENTRIES:
+                    _entries.popitem(last=False)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def invalidate(*names: str) -> None:
+    """Drop cached results for the named tools, or everything if none given."""
+    with _lock:
+        if not names:
+            _entries.clear()
+            return
+        for key in [k for k in _entries if k[0] in names]:
+            del _entries[key]
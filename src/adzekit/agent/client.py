@@ -4,11 +4,16 @@ Thin wrapper around the Anthropic SDK. Reads ANTHROPIC_API_KEY from
 environment or .env file. All agent interactions go through this module.
 """
 
+import functools
 import os
+from typing import TYPE_CHECKING
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+if TYPE_CHECKING:
+    from anthropic import Anthropic, AsyncAnthropic
+
 
 class LLMSettings(BaseSettings):
     """LLM configuration. Reads from env / .env."""
@@ -23,6 +28,10 @@ class LLMSettings(BaseSettings):
         default="",
         description="Anthropic API key.",
     )
+    anthropic_base_url: str = Field(
+        default="",
+        description="Anthropic API base URL (empty for the SDK default).",
+    )
     anthropic_model: str = Field(
         default="claude-sonnet-4-20250514",
         description="Anthropic model ID.",
@@ -31,24 +40,139 @@ class LLMSettings(BaseSettings):
         default=4096,
         description="Maximum tokens per response.",
     )
+    max_parallel_requests: int = Field(
+        default=4,
+        description="Maximum concurrent LLM requests across agent runs.",
+    )
+    tokens_per_minute: int = Field(
+        default=40_000,
+        description="Input-token rate limit for the Anthropic account tier.",
+    )
+    history_max_chars: int = Field(
+        default=60_000,
+        description="Tool output kept in an agent conversation before pruning.",
+    )
+    history_keep_turns: int = Field(
+        default=2,
+        description="Most recent tool-calling rounds never pruned from history.",
+    )
 
 
+# Connection pool tuning for back-to-back agent turns.
+_MAX_KEEPALIVE_CONNECTIONS = 20
+_MAX_CONNECTIONS = 100
+_KEEPALIVE_EXPIRY = 30.0
+_REQUEST_TIMEOUT = 60.0
+_CONNECT_TIMEOUT = 10.0
+
+# Clients keyed by (api_key, base_url) so every turn of the agent loop
+# reuses the same connection pool instead of re-handshaking.
+_client_cache: dict[tuple[str, str], "Anthropic"] = {}
+_async_client_cache: dict[tuple[str, str], "AsyncAnthropic"] = {}
+
+
+@functools.lru_cache(maxsize=1)
 def get_llm_settings() -> LLMSettings:
     return LLMSettings()
 
 
-def create_client(settings: LLMSettings | None = None):
-    """Create an Anthropic client instance."""
-    from anthropic import Anthropic
-
-    settings = settings or get_llm_settings()
+def _client_key(settings: LLMSettings) -> tuple[str, str]:
+    """Return the (api_key, base_url) cache key, raising if no key is set."""
     api_key = settings.anthropic_api_key or os.environ.get("ANTHROPIC_API_KEY", "")
     if not api_key:
         raise ValueError(
             "ANTHROPIC_API_KEY is not set. "
             "Set it in your environment or in a .env file."
         )
-    return Anthropic(api_key=api_key)
+    return api_key, settings.anthropic_base_url
+
+
+def _client_options() -> dict:
+    """Connection limits and timeout shared by the sync and async clients."""
+    from anthropic import DEFAULT_CONNECTION_LIMITS, Timeout
+
+    # Build Limits from the SDK's own httpx flavour (httpx or httpx2).
+    limits_cls = type(DEFAULT_CONNECTION_LIMITS)
+    return {
+        "limits": limits_cls(
+            max_keepalive_connections=_MAX_KEEPALIVE_CONNECTIONS,
+            max_connections=_MAX_CONNECTIONS,
+            keepalive_expiry=_KEEPALIVE_EXPIRY,
+        ),
+        "timeout": Timeout(_REQUEST_TIMEOUT, connect=_CONNECT_TIMEOUT),
+    }
+
+
+def create_client(settings: LLMSettings | None = None):
+    """Return a shared Anthropic client, creating it on first use."""
+    settings = settings or get_llm_settings()
+    key = _client_key(settings)
+    client = _client_cache.get(key)
+    if client is None:
+        from anthropic import Anthropic, DefaultHttpxClient
+
+        options = _client_options()
+        api_key, base_url = key
+        client = Anthropic(
+            api_key=api_key,
+            base_url=base_url or None,
+            timeout=options["timeout"],
+            http_client=DefaultHttpxClient(limits=options["limits"]),
+        )
+        _client_cache[key] = client
+    return client
+
+
+def create_async_client(settings: LLMSettings | None = None):
+    """Return a shared AsyncAnthropic client, creating it on first use."""
+    settings = settings or get_llm_settings()
+    key = _client_key(settings)
+    client = _async_client_cache.get(key)
+    if client is None:
+        from anthropic import AsyncAnthropic, DefaultAsyncHttpxClient
+
+        options = _client_options()
+        api_key, base_url = key
+        client = AsyncAnthropic(
+            api_key=api_key,
+            base_url=base_url or None,
+            timeout=options["timeout"],
+            http_client=DefaultAsyncHttpxClient(limits=options["limits"]),
+        )
+        _async_client_cache[key] = client
+    return client
+
+
+def close_clients() -> None:
+    """Close and forget every cached sync client (used for test teardown)."""
+    for client in _client_cache.values():
+        client.close()
+    _client_cache.clear()
+
+
+async def aclose_clients() -> None:
+    """Close and forget every cached async client."""
+    for client in _async_client_cache.values():
+        await client.close()
+    _async_client_cache.clear()
+
+
+def _message_kwargs(
+    messages: list[dict],
+    system: str,
+    tools: list[dict] | None,
+    settings: LLMSettings,
+) -> dict:
+    kwargs: dict = {
+        "model": settings.anthropic_model,
+        "max_tokens": settings.max_tokens,
+        "messages": messages,
+    }
+    if system:
+        kwargs["system"] = system
+    if tools:
+        kwargs["tools"] = tools
+    return kwargs
 
 
 def chat(
@@ -70,15 +194,16 @@ def chat(
     """
     settings = settings or get_llm_settings()
     client = create_client(settings)
+    return client.messages.create(**_message_kwargs(messages, system, tools, settings))
 
-    kwargs: dict = {
-        "model": settings.anthropic_model,
-        "max_tokens": settings.max_tokens,
-        "messages": messages,
-    }
-    if system:
-        kwargs["system"] = system
-    if tools:
-        kwargs["tools"] = tools
 
-    return client.messages.create(**kwargs)
+async def achat(
+    messages: list[dict],
+    system: str = "",
+    tools: list[dict] | None = None,
+    settings: LLMSettings | None = None,
+) -> dict:
+    """Async variant of chat() using the shared AsyncAnthropic client."""
+    settings = settings or get_llm_settings()
+    client = create_async_client(settings)
+    return await client.messages.create(**_message_kwargs(messages, system, tools, settings))
@@ -0,0 +1,111 @@
+"""Conversation history with size-bounded tool output.
+
+Every agent iteration appends the assistant's tool_use blocks and the tool
+results, so later turns resend all earlier tool output verbatim. Once the
+tool output in the history exceeds a character budget, the oldest results
+(outside the last few turns) are replaced by a short synopsis. The full
+text stays available to the agent through the agent_recall tool.
+"""
+
+from adzekit.agent.tools import dumps
+
+RECALL_TOOL_NAME = "agent_recall"
+
+RECALL_TOOL = {
+    "name": RECALL_TOOL_NAME,
+    "description": (
+        "Fetch the full output of an earlier tool call whose result was "
+        "truncated from the conversation to save space."
+    ),
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "tool_use_id": {
+                "type": "string",
+                "description": "The tool_use_id named in the truncated result.",
+            },
+        },
+        "required": ["tool_use_id"],
+    },
+}
+
+
+class ConversationHistory:
+    """Message list for one agent session, pruned past ``max_chars``."""
+
+    def __init__(
+        self,
+        messages: list[dict],
+        *,
+        max_chars: int,
+        keep_turns: int,
+    ) -> None:
+        self.messages = messages
+        self.max_chars = max_chars
+        self.keep_turns = keep_turns
+        self.pruned = False
+        self._full: dict[str, str] = {}
+        self._names: dict[str, str] = {}
+        self._size = 0
+
+    def add_turn(
+        self,
+        assistant_content: list,
+        tool_use_blocks: list[dict],
+        tool_results: list[dict],
+    ) -> None:
+        """Append one assistant/tool-result exchange, then prune if needed."""
+        for tc, tr in zip(tool_use_blocks, tool_results):
+            self._names[tc["id"]] = tc["name"]
+            self._full[tc["id"]] = tr["content"]
+            self._size += len(tr["content"])
+
+        self.messages.append({"role": "assistant", "content": assistant_content})
+        self.messages.append({"role": "user", "content": tool_results})
+        if self._size > self.max_chars:
+            self._prune()
+
+    def recall(self, tool_use_id: str) -> str | dict:
+        """Return the full output of an earlier tool call."""
+        content = self._full.get(tool_use_id)
+        if content is None:
+            return {"error": f"No tool result with id: {tool_use_id}"}
+        return content
+
+    def _prune(self) -> None:
+        """Replace the oldest tool results with synopses until under budget."""
+        result_indexes = [
+            i for i, m in enumerate(self.messages)
+            if m["role"] == "user" and isinstance(m["content"], list)
+        ]
+        if self.keep_turns:
+            result_indexes = result_indexes[:-self.keep_turns]
+
+        for i in result_indexes:
+            blocks = []
+            for block in self.messages[i]["content"]:
+                tool_use_id = block.get("tool_use_id")
+                if (
+                    self._size > self.max_chars
+                    and block.get("type") == "tool_result"
+                    and tool_use_id in self._full
+                    and block["content"] is self._full[tool_use_id]
+                ):
+                    synopsis = self._synopsis(tool_use_id)
+                    if len(synopsis) < len(block["content"]):
+                        self._size += len(synopsis) - len(block["content"])
+                        block = {**block, "content": synopsis}
+                        self.pruned = True
+                blocks.append(block)
+            # New list and dicts so AgentTurn.tool_results keep the full output.
+            self.messages[i] = {**self.messages[i], "content": blocks}
+            if self._size <= self.max_chars:
+                return
+
+    def _synopsis(self, tool_use_id: str) -> str:
+        return dumps({
+            "truncated": f"Output removed to save space; call {RECALL_TOOL_NAME} to fetch it.",
+            "tool": self._names[tool_use_id],
+            "tool_use_id": tool_use_id,
+            "bytes": len(self._full[tool_use_id]),
+        })
@@ -5,10 +5,14 @@ When the LLM returns tool_use blocks, the orchestrator executes them
 and feeds results back until the LLM produces a final text response.
 """
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 
-from adzekit.agent.client import LLMSettings, chat, get_llm_settings
-from adzekit.agent.tools import ToolRegistry
+from adzekit.agent.client import LLMSettings, achat, chat, get_llm_settings
+from adzekit.agent.history import RECALL_TOOL, RECALL_TOOL_NAME, ConversationHistory
+from adzekit.agent.scheduler import LLMScheduler, estimate_tokens
+from adzekit.agent.tools import ToolRegistry, tool_result_content
 from adzekit.agent.tools import registry as global_registry
 
 SYSTEM_PROMPT = """\
@@ -53,6 +57,231 @@ class AgentResult:
     tool_calls_made: int
 
 
+def _parse_response(response) -> AgentTurn:
+    """Split an LLM response into its text and tool_use blocks."""
+    text_parts = []
+    tool_use_blocks = []
+
+    for block in response.content:
+        if block.type == "text":
+            text_parts.append(block.text)
+        elif block.type == "tool_use":
+            tool_use_blocks.append({
+                "id": block.id,
+                "name": block.name,
+                "input": block.input,
+            })
+
+    return AgentTurn(
+        role="assistant",
+        content="\n".join(text_parts),
+        tool_calls=tool_use_blocks,
+    )
+
+
+def _tool_results(tool_use_blocks: list[dict], results: list) -> list[dict]:
+    """Pair each tool result with its tool_use_id, preserving order."""
+    return [
+        {
+            "type": "tool_result",
+            "tool_use_id": tc["id"],
+            "content": tool_result_content(result),
+        }
+        for tc, result in zip(tool_use_blocks, results)
+    ]
+
+
+def _new_history(
+    conversation_history: list[dict] | None,
+    user_message: str,
+    settings: LLMSettings,
+) -> ConversationHistory:
+    messages = list(conversation_history or [])
+    messages.append({"role": "user", "content": user_message})
+    return ConversationHistory(
+        messages,
+        max_chars=settings.history_max_chars,
+        keep_turns=settings.history_keep_turns,
+    )
+
+
+def _tools_for(tools_schema: list[dict], history: ConversationHistory) -> list[dict] | None:
+    """Tool schemas for the next LLM call, adding agent_recall once pruned."""
+    if not tools_schema:
+        return None
+    if history.pruned:
+        return [*tools_schema, RECALL_TOOL]
+    return tools_schema
+
+
+def _call_tool(
+    reg: ToolRegistry,
+    history: ConversationHistory,
+    name: str,
+    arguments: dict,
+) -> str | dict:
+    if name == RECALL_TOOL_NAME:
+        return history.recall(arguments.get("tool_use_id", ""))
+    return reg.call(name, arguments)
+
+
+class _AgentLoop:
+    """Per-run bookkeeping shared by the sync and async agent loops.
+
+    The callers only make the LLM call and run the tools; parsing each
+    response, deciding whether it is final, and recording the turn in the
+    history all happen here.
+    """
+
+    def __init__(
+        self,
+        reg: ToolRegistry,
+        conversation_history: list[dict] | None,
+        user_message: str,
+        settings: LLMSettings,
+    ) -> None:
+        self.registry = reg
+        self.tools_schema = reg.to_anthropic_tools()
+        self.history = _new_history(conversation_history, user_message, settings)
+        self.turns: list[AgentTurn] = []
+        self.total_tool_calls = 0
+        self.result: AgentResult | None = None
+
+    @property
+    def tools(self) -> list[dict] | None:
+        return _tools_for(self.tools_schema, self.history)
+
+    def start_turn(self, response) -> AgentTurn | None:
+        """Parse a response; return the turn to run tools for, or None when final.
+
+        A final answer (no tool calls) is recorded and stored in ``result``.
+        """
+        turn = _parse_response(response)
+        if not turn.tool_calls:
+            self.turns.append(turn)
+            self.result = AgentResult(
+                response=turn.content,
+                turns=self.turns,
+                tool_calls_made=self.total_tool_calls,
+            )
+            return None
+        return turn
+
+    def call_tool(self, tc: dict) -> str | dict:
+        return _call_tool(self.registry, self.history, tc["name"], tc["input"])
+
+    def finish_turn(self, response, turn: AgentTurn, results: list) -> None:
+        """Pair results with their tool calls and append the turn to the history."""
+        tool_results = _tool_results(turn.tool_calls, results)
+        self.total_tool_calls += len(tool_results)
+        turn.tool_results = tool_results
+        self.turns.append(turn)
+        # Prunes old tool output once the history grows past its budget.
+        self.history.add_turn(response.content, turn.tool_calls, tool_results)
+
+    def final_result(self) -> AgentResult:
+        """Build the result returned when max_iterations is reached."""
+        turns = self.turns
+        final_text = turns[-1].content if turns else "Agent reached maximum iterations."
+        return AgentResult(
+            response=final_text,
+            turns=turns,
+            tool_calls_made=self.total_tool_calls,
+        )
+
+
+class AgentRunner:
+    """Runs the agentic loop, executing each turn's tool calls concurrently.
+
+    Tools are I/O-bound (filesystem, HTTP), so the tool_use blocks from a
+    single LLM turn are dispatched to a thread pool that is reused across
+    iterations. Use as a context manager, or call close() when done.
+    """
+
+    def __init__(
+        self,
+        *,
+        tool_registry: ToolRegistry | None = None,
+        system_prompt: str = SYSTEM_PROMPT,
+        settings: LLMSettings | None = None,
+        max_iterations: int = 15,
+        max_workers: int = 8,
+    ) -> None:
+        self.registry = tool_registry or global_registry
+        self.system_prompt = system_prompt
+        self.settings = settings or get_llm_settings()
+        self.max_iterations = max_iterations
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="adzekit-tool",
+        )
+
+    def __enter__(self) -> "AgentRunner":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+
+    def _execute_tools(self, tool_use_blocks: list[dict], loop: _AgentLoop) -> list:
+        """Run tool calls in parallel, returning results in the original order."""
+        if len(tool_use_blocks) == 1:
+            return [loop.call_tool(tool_use_blocks[0])]
+        futures = [self._executor.submit(loop.call_tool, tc) for tc in tool_use_blocks]
+        return [f.result() for f in futures]
+
+    def run(
+        self,
+        user_message: str,
+        conversation_history: list[dict] | None = None,
+    ) -> AgentResult:
+        """Run the loop until the LLM produces a final text answer."""
+        loop = _AgentLoop(self.registry, conversation_history, user_message, self.settings)
+
+        for _ in range(self.max_iterations):
+            response = chat(
+                messages=loop.history.messages,
+                system=self.system_prompt,
+                tools=loop.tools,
+                settings=self.settings,
+            )
+            turn = loop.start_turn(response)
+            if turn is None:
+                return loop.result
+            loop.finish_turn(response, turn, self._execute_tools(turn.tool_calls, loop))
+
+        # If we hit max iterations, return whatever we have
+        return loop.final_result()
+
+    def run_many(self, user_messages: list[str]) -> list[AgentResult]:
+        """Run one agent session per message concurrently, results in order.
+
+        Sessions share an LLMScheduler so their LLM calls stay within
+        settings.max_parallel_requests and settings.tokens_per_minute.
+        """
+
+        async def _gather() -> list[AgentResult]:
+            scheduler = LLMScheduler(
+                self.settings.max_parallel_requests,
+                self.settings.tokens_per_minute,
+            )
+            return await asyncio.gather(*(
+                run_agent_async(
+                    message,
+                    tool_registry=self.registry,
+                    system_prompt=self.system_prompt,
+                    settings=self.settings,
+                    max_iterations=self.max_iterations,
+                    scheduler=scheduler,
+                )
+                for message in user_messages
+            ))
+
+        return asyncio.run(_gather())
+
+
 def run_agent(
     user_message: str,
     *,
@@ -75,75 +304,57 @@ def run_agent(
     Returns:
         AgentResult with the final text response and execution trace.
     """
-    settings = settings or get_llm_settings()
-    reg = tool_registry or global_registry
-    tools_schema = reg.to_anthropic_tools()
+    with AgentRunner(
+        tool_registry=tool_registry,
+        system_prompt=system_prompt,
+        settings=settings,
+        max_iterations=max_iterations,
+    ) as runner:
+        return runner.run(user_message, conversation_history)
 
-    messages = list(conversation_history or [])
-    messages.append({"role": "user", "content": user_message})
 
-    turns: list[AgentTurn] = []
-    total_tool_calls = 0
-
-    for _ in range(max_iterations):
-        response = chat(
-            messages=messages,
-            system=system_prompt,
-            tools=tools_schema if tools_schema else None,
-            settings=settings,
-        )
+async def run_agent_async(
+    user_message: str,
+    *,
+    tool_registry: ToolRegistry | None = None,
+    system_prompt: str = SYSTEM_PROMPT,
+    settings: LLMSettings | None = None,
+    max_iterations: int = 15,
+    conversation_history: list[dict] | None = None,
+    scheduler: LLMScheduler | None = None,
+) -> AgentResult:
+    """Async variant of run_agent() for running many sessions on one event loop.
 
-        # Parse the response content blocks
-        text_parts = []
-        tool_use_blocks = []
-
-        for block in response.content:
-            if block.type == "text":
-                text_parts.append(block.text)
-            elif block.type == "tool_use":
-                tool_use_blocks.append({
-                    "id": block.id,
-                    "name": block.name,
-                    "input": block.input,
-                })
-
-        turn = AgentTurn(
-            role="assistant",
-            content="\n".join(text_parts),
-            tool_calls=tool_use_blocks,
-        )
+    LLM calls go through the shared AsyncAnthropic client; each turn's tool
+    calls are gathered concurrently in worker threads. Pass a shared
+    scheduler to cap parallelism and token rate across concurrent sessions.
+    """
+    settings = settings or get_llm_settings()
+    loop = _AgentLoop(
+        tool_registry or global_registry, conversation_history, user_message, settings
+    )
 
-        # If no tool calls, we have a final answer
-        if not tool_use_blocks:
-            turns.append(turn)
-            return AgentResult(
-                response=turn.content,
-                turns=turns,
-                tool_calls_made=total_tool_calls,
-            )
+    for _ in range(max_iterations):
+        tools = loop.tools
+        kwargs = {
+            "messages": loop.history.messages,
+            "system": system_prompt,
+            "tools": tools,
+            "settings": settings,
+        }
+        if scheduler is None:
+            response = await achat(**kwargs)
+        else:
+            expected = estimate_tokens(loop.history.messages, system_prompt, tools)
+            async with scheduler.slot(expected):
+                response = await achat(**kwargs)
 
-        # Execute each tool call and collect results
-        tool_results = []
-        for tc in tool_use_blocks:
-            result_str = reg.call(tc["name"], tc["input"])
-            tool_results.append({
-                "type": "tool_result",
-                "tool_use_id": tc["id"],
-                "content": result_str,
-            })
-            total_tool_calls += 1
+        turn = loop.start_turn(response)
+        if turn is None:
+            return loop.result
+        results = await asyncio.gather(*(
+            asyncio.to_thread(loop.call_tool, tc) for tc in turn.tool_calls
+        ))
+        loop.finish_turn(response, turn, list(results))
 
-        turn.tool_results = tool_results
-        turns.append(turn)
-
-        # Append assistant message (with tool_use blocks) and tool results
-        messages.append({"role": "assistant", "content": response.content})
-        messages.append({"role": "user", "content": tool_results})
-
-    # If we hit max iterations, return whatever we have
-    final_text = turns[-1].content if turns else "Agent reached maximum iterations."
-    return AgentResult(
-        response=final_text,
-        turns=turns,
-        tool_calls_made=total_tool_calls,
-    )
+    return loop.final_result()
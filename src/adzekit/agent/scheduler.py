@@ -0,0 +1,65 @@
+"""Backpressure for concurrent agent runs.
+
+When several agent sessions run on one event loop (e.g. bulk triage via
+AgentRunner.run_many), their LLM calls share an LLMScheduler: a semaphore
+caps requests in flight and a token bucket keeps the estimated input-token
+rate under the account's per-minute limit.
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+# Rough chars-per-token ratio used to estimate request size before sending.
+_CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(*parts: object) -> int:
+    """Cheap upper-bound-ish token estimate for a request's payload."""
+    return sum(len(str(p)) for p in parts if p) // _CHARS_PER_TOKEN
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at ``tokens_per_minute``."""
+
+    def __init__(self, tokens_per_minute: int) -> None:
+        self.capacity = float(tokens_per_minute)
+        self.rate = tokens_per_minute / 60.0
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, tokens: int) -> None:
+        """Wait until ``tokens`` are available, then consume them.
+
+        Requests larger than the bucket are clamped to its capacity so they
+        wait for a full bucket instead of blocking forever.
+        """
+        needed = min(float(tokens), self.capacity)
+        async with self._lock:
+            self._refill()
+            while self._tokens < needed:
+                await asyncio.sleep((needed - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= needed
+
+
+class LLMScheduler:
+    """Shared concurrency and rate limit for LLM calls on one event loop."""
+
+    def __init__(self, max_parallel: int, tokens_per_minute: int) -> None:
+        self._semaphore = asyncio.Semaphore(max_parallel)
+        self._bucket = TokenBucket(tokens_per_minute)
+
+    @asynccontextmanager
+    async def slot(self, expected_tokens: int) -> AsyncIterator[None]:
+        """Hold one parallel slot with ``expected_tokens`` of rate budget."""
+        async with self._semaphore:
+            await self._bucket.acquire(expected_tokens)
+            yield
@@ -11,10 +11,14 @@ When the agent wants to suggest a loop, bench item, or any backbone change,
 it writes a proposal to drafts/ for the human to review and apply.
 """
 
-import json
+import os
+import re
 from datetime import date
+from pathlib import Path
+from typing import Any, Callable
 
-from adzekit.agent.tools import registry
+from adzekit.agent.cache import cached_tool, invalidate
+from adzekit.agent.tools import dumps, registry
 from adzekit.config import Settings, get_settings
 from adzekit.models import Loop
 from adzekit.parser import format_loop
@@ -25,6 +29,39 @@ def _settings() -> Settings:
     return get_settings()
 
 
+# Parsed backbone objects keyed by loader name + paths, stored alongside the
+# stat fingerprint of those paths. Reparsed only when a file changes.
+_parse_cache: dict[tuple, tuple[tuple, Any]] = {}
+
+
+def _fingerprint(path: Path) -> tuple:
+    """Return (mtime_ns, size) for a file, or for each .md file in a directory."""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return ()
+    if not path.is_dir():
+        return (st.st_mtime_ns, st.st_size)
+    with os.scandir(path) as it:
+        return tuple(sorted(
+            (e.name, e.stat().st_mtime_ns, e.stat().st_size)
+            for e in it
+            if e.name.endswith(".md") and e.is_file()
+        ))
+
+
+def _cached_load(name: str, paths: list[Path], loader: Callable[[], Any]) -> Any:
+    """Return loader()'s result, reusing it while none of paths have changed."""
+    key = (name, tuple(paths))
+    fingerprint = tuple(_fingerprint(p) for p in paths)
+    hit = _parse_cache.get(key)
+    if hit is not None and hit[0] == fingerprint:
+        return hit[1]
+    value = loader()
+    _parse_cache[key] = (fingerprint, value)
+    return value
+
+
 # ---------------------------------------------------------------------------
 # READ-ONLY backbone tools
 # ---------------------------------------------------------------------------
@@ -35,20 +72,23 @@ def _settings() -> Settings:
     description="Get all active loops (commitments) from the shed. Read-only.",
 )
 def shed_get_active_loops() -> str:
-    loops = load_active_loops(_settings())
+    settings = _settings()
+    loops = _cached_load(
+        "active_loops", [settings.loops_active], lambda: load_active_loops(settings),
+    )
     if not loops:
-        return json.dumps({"count": 0, "loops": []})
+        return dumps({"count": 0, "loops": []})
     result = []
     for loop in loops:
         result.append({
             "title": loop.title,
-            "date": loop.date.isoformat(),
+            "date": loop.date,
             "size": loop.size,
-            "due": loop.due.isoformat() if loop.due else None,
+            "due": loop.due,
             "status": loop.status,
             "who": loop.who,
         })
-    return json.dumps({"count": len(result), "loops": result})
+    return dumps({"count": len(result), "loops": result})
 
 
 @registry.register(
@@ -56,12 +96,16 @@ def shed_get_active_loops() -> str:
     description="Get today's daily note content. Read-only.",
 )
 def shed_get_today() -> str:
-    note = load_daily_note(settings=_settings())
+    settings = _settings()
+    today_path = settings.daily_dir / f"{date.today().isoformat()}.md"
+    note = _cached_load(
+        "daily_note", [today_path], lambda: load_daily_note(settings=settings),
+    )
     if note is None:
-        return json.dumps({"exists": False})
-    return json.dumps({
+        return dumps({"exists": False})
+    return dumps({
         "exists": True,
-        "date": note.date.isoformat(),
+        "date": note.date,
         "intentions": [{"desc": t.description, "done": t.done} for t in note.intentions],
         "log_entries": [{"time": e.time, "text": e.text} for e in note.log],
         "finished": note.finished,
@@ -74,12 +118,13 @@ def shed_get_today() -> str:
     name="shed_get_bench",
     description="Read the shed bench (pending triage items and quick captures). Read-only.",
 )
+@cached_tool()
 def shed_get_bench() -> str:
     settings = _settings()
     if not settings.bench_path.exists():
-        return json.dumps({"content": ""})
+        return dumps({"content": ""})
     content = settings.bench_path.read_text(encoding="utf-8")
-    return json.dumps({"content": content})
+    return dumps({"content": content})
 
 
 @registry.register(
@@ -87,7 +132,12 @@ def shed_get_bench() -> str:
     description="List active and backlog projects with their progress. Read-only.",
 )
 def shed_get_projects() -> str:
-    projects = load_projects(settings=_settings())
+    settings = _settings()
+    projects = _cached_load(
+        "projects",
+        [settings.active_dir, settings.backlog_dir, settings.archive_dir],
+        lambda: load_projects(settings=settings),
+    )
     result = []
     for p in projects:
         result.append({
@@ -96,9 +146,9 @@ def shed_get_projects() -> str:
             "state": p.state.value,
             "progress": round(p.progress, 2),
             "total_tasks": len(p.tasks),
-            "done_tasks": sum(1 for t in p.tasks if t.done),
+            "done_tasks": p.done_count,
         })
-    return json.dumps({"count": len(result), "projects": result})
+    return dumps({"count": len(result), "projects": result})
 
 
 # ---------------------------------------------------------------------------
@@ -142,7 +192,7 @@ def shed_propose_loop(
 
     # Write proposal to drafts/
     drafts = settings.drafts_dir
-    drafts.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(drafts)
     proposal_path = drafts / f"loop-{date.today().isoformat()}-{_slug(title)}.md"
 
     content = f"""# Proposed Loop
@@ -155,9 +205,10 @@ def shed_propose_loop(
 ## To apply
 Copy the line above into `loops/open.md`.
 """
-    proposal_path.write_text(content, encoding="utf-8")
+    _write_text(proposal_path, content)
+    invalidate("shed_list_drafts")
 
-    return json.dumps({
+    return dumps({
         "action": "propose_add_loop",
         "formatted": formatted,
         "proposal_file": str(proposal_path.name),
@@ -180,7 +231,7 @@ def shed_propose_bench_item(text: str) -> str:
     entry = f"- [{date.today().isoformat()}] {text}"
 
     drafts = settings.drafts_dir
-    drafts.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(drafts)
     proposal_path = drafts / f"bench-{date.today().isoformat()}-{_slug(text[:40])}.md"
 
     content = f"""# Proposed Bench Item
@@ -190,9 +241,10 @@ def shed_propose_bench_item(text: str) -> str:
 ## To apply
 Copy the line above into the `## Quick Capture` section of `bench.md`.
 """
-    proposal_path.write_text(content, encoding="utf-8")
+    _write_text(proposal_path, content)
+    invalidate("shed_list_drafts")
 
-    return json.dumps({
+    return dumps({
         "action": "propose_bench_item",
         "formatted": entry,
         "proposal_file": str(proposal_path.name),
@@ -214,17 +266,18 @@ Copy the line above into the `## Quick Capture` section of `bench.md`.
 def shed_save_summary(filename: str, content: str) -> str:
     settings = _settings()
     drafts = settings.drafts_dir
-    drafts.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(drafts)
 
     # Sanitize filename
-    safe_name = "".join(c if c.isalnum() or c in "-_." else "-" for c in filename)
+    safe_name = _SAFE_NAME_RE.sub("-", filename)
     if not safe_name.endswith(".md"):
         safe_name += ".md"
 
     path = drafts / safe_name
-    path.write_text(content, encoding="utf-8")
+    _write_text(path, content)
+    invalidate("shed_list_drafts")
 
-    return json.dumps({
+    return dumps({
         "status": "saved",
         "path": f"drafts/{safe_name}",
         "note": "Summary saved to drafts/ for review.",
@@ -251,13 +304,13 @@ def shed_save_summary(filename: str, content: str) -> str:
 def shed_save_to_stock(project_slug: str, filename: str, content: str) -> str:
     settings = _settings()
     stock_project = settings.stock_dir / project_slug
-    stock_project.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(stock_project)
 
-    safe_name = "".join(c if c.isalnum() or c in "-_." else "-" for c in filename)
+    safe_name = _SAFE_NAME_RE.sub("-", filename)
     path = stock_project / safe_name
-    path.write_text(content, encoding="utf-8")
+    _write_text(path, content)
 
-    return json.dumps({
+    return dumps({
         "status": "saved",
         "path": f"stock/{project_slug}/{safe_name}",
     })
@@ -282,25 +335,35 @@ def shed_get_graph_context(entity: str, depth: int = 2) -> str:
     settings = _settings()
     graph = load_graph(settings)
     if graph is None:
-        return json.dumps({
+        return dumps({
             "error": "Graph not built. Run: adzekit graph build",
             "entity": entity,
         })
     context = get_context(entity, graph, depth=depth)
-    return json.dumps({"entity": entity, "depth": depth, "context": context})
+    return dumps({"entity": entity, "depth": depth, "context": context})
 
 
 @registry.register(
     name="shed_list_drafts",
     description="List all files in drafts/ awaiting human review.",
+    param_descriptions={
+        "limit": "Return only the last N files in name order (0 for all).",
+    },
 )
-def shed_list_drafts() -> str:
+@cached_tool()
+def shed_list_drafts(limit: int = 0) -> str:
     settings = _settings()
     drafts = settings.drafts_dir
     if not drafts.exists():
-        return json.dumps({"count": 0, "files": []})
-    files = sorted(f.name for f in drafts.iterdir() if f.is_file())
-    return json.dumps({"count": len(files), "files": files})
+        return dumps({"count": 0, "files": []})
+    # DirEntry.is_file() uses the d_type from readdir -- no stat per entry.
+    with os.scandir(drafts) as it:
+        files = [e.name for e in it if e.is_file(follow_symlinks=False)]
+    files.sort()
+    if limit > 0:
+        # Draft names embed their creation date, so this favours recent files.
+        files = files[-limit:]
+    return dumps({"count": len(files), "files": files})
 
 
 # ---------------------------------------------------------------------------
@@ -308,7 +371,44 @@ def shed_list_drafts() -> str:
 # ---------------------------------------------------------------------------
 
 
+# Each character that is not alphanumeric (or an allowed separator) becomes "-".
+_SLUG_RE = re.compile(r"[^\w-]|_")
+_SAFE_NAME_RE = re.compile(r"[^\w.-]")
+
+
+# Writable directories already created by this process.
+_ensured_dirs: set[Path] = set()
+
+
+def _ensure_dir(path: Path) -> None:
+    """Create a writable directory once per process."""
+    if path not in _ensured_dirs:
+        path.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(path)
+
+
+def _write_text(path: Path, content: str) -> None:
+    """Write a small UTF-8 file with raw os calls, skipping TextIOWrapper.
+
+    Like Path.write_text: an existing file is truncated in place and keeps
+    its mode, and a new one is created 0o666 minus the umask.
+    """
+    data = memoryview(content.encode("utf-8"))
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+    try:
+        fd = os.open(path, flags, 0o666)
+    except FileNotFoundError:
+        # The directory was removed since _ensure_dir saw it; recreate it.
+        _ensured_dirs.discard(path.parent)
+        _ensure_dir(path.parent)
+        fd = os.open(path, flags, 0o666)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+
 def _slug(text: str) -> str:
     """Convert text to a filesystem-safe slug."""
-    raw = "".join(c if c.isalnum() or c == "-" else "-" for c in text.lower().strip())
-    return raw[:50].strip("-")
+    return _SLUG_RE.sub("-", text.lower().strip())[:50].strip("-")
@@ -7,10 +7,19 @@ them so the orchestrator can expose them to the LLM as callable tools.
 
 import inspect
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Callable, get_type_hints
 
 
+def dumps(obj: Any) -> str:
+    """Serialize a tool result to JSON.
+
+    Dates and other non-JSON types are rendered with str() (ISO format for
+    dates), so the bytes sent to the model do not depend on optional packages.
+    """
+    return json.dumps(obj, default=str)
+
+
 @dataclass
 class ToolParam:
     """A single parameter for a tool."""
@@ -24,15 +33,18 @@ class ToolParam:
 
 @dataclass
 class ToolDef:
-    """A registered tool with its callable and schema."""
+    """A registered tool with its callable and schema.
+
+    The Anthropic schema is built once, when the tool is registered.
+    """
 
     name: str
     description: str
     parameters: list[ToolParam]
     fn: Callable[..., Any]
+    schema: dict = field(init=False, repr=False)
 
-    def to_anthropic_schema(self) -> dict:
-        """Convert to Anthropic tool-use schema."""
+    def __post_init__(self) -> None:
         properties = {}
         required = []
         for p in self.parameters:
@@ -42,7 +54,7 @@ class ToolDef:
             properties[p.name] = prop
             if p.required:
                 required.append(p.name)
-        return {
+        self.schema = {
             "name": self.name,
             "description": self.description,
             "input_schema": {
@@ -52,12 +64,17 @@ class ToolDef:
             },
         }
 
+    def to_anthropic_schema(self) -> dict:
+        """Return the precomputed Anthropic tool-use schema."""
+        return self.schema
+
 
 class ToolRegistry:
     """Collects tool definitions and dispatches calls."""
 
     def __init__(self) -> None:
         self._tools: dict[str, ToolDef] = {}
+        self._schema_cache: list[dict] | None = None
 
     def register(
         self,
@@ -80,7 +97,11 @@ class ToolRegistry:
         def decorator(func: Callable) -> Callable:
             tool_name = name or func.__name__
             tool_desc = description or (func.__doc__ or "").strip().split("\n")[0]
-            hints = get_type_hints(func)
+            # Plain annotations are already types; only resolve string
+            # (forward-ref / postponed) annotations through get_type_hints.
+            hints = getattr(func, "__annotations__", {})
+            if any(isinstance(h, str) for h in hints.values()):
+                hints = get_type_hints(func)
             sig = inspect.signature(func)
             params = []
             descs = param_descriptions or {}
@@ -104,6 +125,7 @@ class ToolRegistry:
                 parameters=params,
                 fn=func,
             )
+            self._schema_cache = None
             return func
 
         if fn is not None:
@@ -117,36 +139,51 @@ class ToolRegistry:
         return list(self._tools.values())
 
     def to_anthropic_tools(self) -> list[dict]:
-        return [t.to_anthropic_schema() for t in self._tools.values()]
+        """Return the tool schemas, rebuilt only after a new registration.
 
-    def call(self, name: str, arguments: dict[str, Any]) -> str:
-        """Execute a tool by name with the given arguments. Returns a string result."""
+        The returned list is shared between callers and must not be mutated.
+        """
+        if self._schema_cache is None:
+            self._schema_cache = [t.to_anthropic_schema() for t in self._tools.values()]
+        return self._schema_cache
+
+    def call(self, name: str, arguments: dict[str, Any]) -> str | dict:
+        """Execute a tool by name with the given arguments.
+
+        String results are returned as-is; structured results (and errors) are
+        returned as Python objects and serialized once, at the boundary to the
+        LLM, by tool_result_content().
+        """
         tool = self._tools.get(name)
         if tool is None:
-            return json.dumps({"error": f"Unknown tool: {name}"})
+            return {"error": f"Unknown tool: {name}"}
         try:
-            result = tool.fn(**arguments)
-            if isinstance(result, str):
-                return result
-            return json.dumps(result, default=str)
+            return tool.fn(**arguments)
         except Exception as exc:
-            return json.dumps({"error": f"{type(exc).__name__}: {exc}"})
+            return {"error": f"{type(exc).__name__}: {exc}"}
+
+
+def tool_result_content(result: Any) -> str:
+    """Serialize a tool result for an Anthropic tool_result block."""
+    if isinstance(result, str):
+        return result
+    return dumps(result)
+
+
+# Keyed by id() so lookups never hash the annotation (which may be unhashable).
+_JSON_TYPE_BY_ID = {
+    id(str): "string",
+    id(int): "integer",
+    id(float): "number",
+    id(bool): "boolean",
+    id(list): "array",
+    id(dict): "object",
+}
 
 
 def _python_type_to_json(t: type) -> str:
     """Map Python types to JSON Schema types."""
-    mapping = {
-        str: "string",
-        int: "integer",
-        float: "number",
-        bool: "boolean",
-        list: "array",
-        dict: "object",
-    }
-    origin = getattr(t, "__origin__", None)
-    if origin is not None:
-        t = origin
-    return mapping.get(t, "string")
+    return _JSON_TYPE_BY_ID.get(id(getattr(t, "__origin__", t)), "string")
 
 
 # Global registry -- tools register themselves on import
@@ -12,11 +12,19 @@ Usage:
 """
 
 import argparse
-import shutil
-import subprocess
+import functools
+import io
+import mmap
+import operator
+import os
+import re
 import sys
-from datetime import date
-from pathlib import Path
+from typing import TYPE_CHECKING, Callable
+
+from adzekit import __version__
+
+if TYPE_CHECKING:
+    from pathlib import Path
 
 
 def _resolve_settings(args: argparse.Namespace, *, require_init: bool = True):
@@ -32,12 +40,12 @@ def _resolve_settings(args: argparse.Namespace, *, require_init: bool = True):
     if the resolved shed directory does not contain a .adzekit marker file.
     Only ``init`` and ``adze`` should pass require_init=False.
     """
-    from adzekit.config import Settings, get_settings
+    from adzekit.config import get_settings, settings_for
 
     shed = getattr(args, "shed", None)
     if shed:
         # Explicit --shed flag overrides everything
-        settings = Settings(shed=Path(shed).expanduser().resolve())
+        settings = settings_for(shed.resolve())
     else:
         # Use get_settings() so ~/.config/adzekit/config is honoured
         settings = get_settings()
@@ -55,6 +63,7 @@ ADZE = r"""
 
  A D Z E K I T
 """
+_ADZE_BYTES = (ADZE + "\n").encode("ascii")
 
 
 # -- adze ------------------------------------------------------------------
@@ -62,7 +71,7 @@ ADZE = r"""
 
 def cmd_adze(args: argparse.Namespace) -> None:
     """Print the AdzeKit symbol."""
-    print(ADZE)
+    _write_bytes(_ADZE_BYTES)
 
 
 # -- init ------------------------------------------------------------------
@@ -70,10 +79,12 @@ def cmd_adze(args: argparse.Namespace) -> None:
 
 def cmd_init(args: argparse.Namespace) -> None:
     """Initialize a new AdzeKit shed with the full backbone structure."""
+    from pathlib import Path
+
     from adzekit.config import Settings
     from adzekit.workspace import init_shed
 
-    path = Path(args.path).expanduser().resolve() if args.path else Path.cwd()
+    path = args.path.resolve() if args.path else Path.cwd()
     settings = Settings(shed=path)
     root = init_shed(settings)
 
@@ -82,25 +93,51 @@ def cmd_init(args: argparse.Namespace) -> None:
     _print_tree(root, root)
 
 
-def _print_tree(root: Path, base: Path, prefix: str = "") -> None:
+def _tree_entries(path: str) -> list[tuple[os.DirEntry, bool]]:
+    """Visible entries of a directory: non-hidden dirs first, then .md files.
+
+    Each entry is paired with its is_dir flag so callers don't re-probe it.
+    """
+    dirs: list[os.DirEntry] = []
+    files: list[os.DirEntry] = []
+    with os.scandir(path) as it:
+        for e in it:
+            if e.is_dir(follow_symlinks=False):
+                if not e.name.startswith("."):
+                    dirs.append(e)
+            elif e.name.endswith(".md"):
+                files.append(e)
+    by_name = operator.attrgetter("name")
+    dirs.sort(key=by_name)
+    files.sort(key=by_name)
+    return [(d, True) for d in dirs] + [(f, False) for f in files]
+
+
+def _print_tree(root: "Path", base: "Path", prefix: str = "") -> None:
     """Print a directory tree rooted at base, showing only dirs and .md files."""
-    entries = sorted(base.iterdir(), key=lambda p: (not p.is_dir(), p.name))
-    # Filter: show dirs (skip hidden) and .md files
-    entries = [
-        e for e in entries
-        if (e.is_dir() and not e.name.startswith("."))
-        or e.suffix == ".md"
-    ]
-    for i, entry in enumerate(entries):
-        is_last = i == len(entries) - 1
-        connector = "└── " if is_last else "├── "
-        name = entry.name
-        if entry.is_dir():
-            print(f"{prefix}{connector}{name}/")
-            extension = "    " if is_last else "│   "
-            _print_tree(root, entry, prefix + extension)
+    out = io.StringIO()
+    # Depth-first walk with an explicit stack of (entry, is_dir, prefix, is_last).
+    # Siblings share one prefix string, built once per directory.
+    entries = _tree_entries(base)
+    stack = [(e, d, prefix, i == len(entries) - 1) for i, (e, d) in enumerate(entries)]
+    stack.reverse()
+    while stack:
+        entry, is_dir, pre, is_last = stack.pop()
+        out.write(pre)
+        out.write("└── " if is_last else "├── ")
+        out.write(entry.name)
+        if is_dir:
+            out.write("/\n")
+            child_prefix = pre + ("    " if is_last else "│   ")
+            children = _tree_entries(entry.path)
+            last = len(children) - 1
+            stack.extend(
+                (c, d, child_prefix, i == last)
+                for i, (c, d) in reversed(list(enumerate(children)))
+            )
         else:
-            print(f"{prefix}{connector}{name}")
+            out.write("\n")
+    sys.stdout.write(out.getvalue())
 
 
 # -- today -----------------------------------------------------------------
@@ -126,8 +163,7 @@ def cmd_daily_start(args: argparse.Namespace) -> None:
     from adzekit.modules.daily import daily_start
 
     settings = _resolve_settings(args)
-    target = date.fromisoformat(args.date) if args.date else None
-    path, summary = daily_start(target_date=target, settings=settings)
+    path, summary = daily_start(target_date=args.date, settings=settings)
 
     if summary.get("synced"):
         print("Synced workbench from remote (stock is additive-only).")
@@ -155,8 +191,7 @@ def cmd_daily_close(args: argparse.Namespace) -> None:
     from adzekit.modules.daily import daily_close
 
     settings = _resolve_settings(args)
-    target = date.fromisoformat(args.date) if args.date else None
-    success, summary = daily_close(target_date=target, settings=settings)
+    success, summary = daily_close(target_date=args.date, settings=settings)
 
     if summary.get("no_note"):
         print(f"No daily note for {summary['date']}. "
@@ -192,9 +227,10 @@ def cmd_prune_drafts(args: argparse.Namespace) -> None:
     if not deleted:
         print("No stale drafts to prune.")
     else:
-        for p in deleted:
-            print(f"  deleted: {p.name}")
-        print(f"\n{len(deleted)} draft(s) pruned.")
+        sys.stdout.write(
+            "  deleted: " + "\n  deleted: ".join(p.name for p in deleted)
+            + f"\n\n{len(deleted)} draft(s) pruned.\n"
+        )
 
 
 # -- automate --------------------------------------------------------------
@@ -229,36 +265,51 @@ def cmd_review(args: argparse.Namespace) -> None:
     from adzekit.workspace import create_review
 
     settings = _resolve_settings(args)
-    review_date = date.fromisoformat(args.date) if args.date else None
-    path = create_review(target_date=review_date, settings=settings)
+    path = create_review(target_date=args.date, settings=settings)
     print(path)
 
 
 # -- sweep -----------------------------------------------------------------
 
 
+# The Log heading plus the blank lines after it; entries go right after.
+_LOG_HEADING_RE = re.compile(rb"## Log\n*")
+
+
 def _log_sweep_to_daily(count: int, settings) -> None:
     """Append a sweep entry to today's daily note under ## Log."""
-    from adzekit.workspace import create_daily_note
+    from adzekit.workspace import create_daily_note, daily_note_path
 
-    path = create_daily_note(settings=settings)
-    content = path.read_text(encoding="utf-8")
-
-    entry = f"- Swept {count} loop(s) closed"
-    # Insert after the ## Log heading
-    marker = "## Log"
-    idx = content.find(marker)
-    if idx == -1:
-        # No Log section -- append to end
-        content = content.rstrip() + f"\n\n{entry}\n"
-    else:
-        insert_at = idx + len(marker)
-        # Skip any trailing whitespace/newline right after the heading
-        while insert_at < len(content) and content[insert_at] == "\n":
-            insert_at += 1
-        content = content[:insert_at] + entry + "\n" + content[insert_at:]
+    entry = f"- Swept {count} loop(s) closed\n".encode()
 
-    path.write_text(content, encoding="utf-8")
+    # Today's note usually exists by sweep time; only fall back to the
+    # template when the open fails.
+    try:
+        fd = os.open(daily_note_path(settings=settings), os.O_RDWR)
+    except FileNotFoundError:
+        fd = os.open(create_daily_note(settings=settings), os.O_RDWR)
+    try:
+        size = os.fstat(fd).st_size
+        insert_at = -1
+        if size:
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                # One regex pass finds the heading and skips its newlines,
+                # so the tail is copied out of the map exactly once.
+                m = _LOG_HEADING_RE.search(mm)
+                if m is not None:
+                    insert_at = m.end()
+                    tail = mm[insert_at:]
+
+        if insert_at == -1:
+            # No Log section -- append to end
+            content = os.pread(fd, size, 0).rstrip() + b"\n\n" + entry
+            os.pwrite(fd, content, 0)
+            os.ftruncate(fd, len(content))
+        else:
+            # Rewrite only from the insertion point onward
+            os.pwrite(fd, entry + tail, insert_at)
+    finally:
+        os.close(fd)
 
 
 def cmd_sweep(args: argparse.Namespace) -> None:
@@ -271,9 +322,10 @@ def cmd_sweep(args: argparse.Namespace) -> None:
         print("Nothing to sweep -- no closed loops in active.md.")
     else:
         _log_sweep_to_daily(len(swept), settings)
-        for loop in swept:
-            print(f"  swept: {loop.title}")
-        print(f"\n{len(swept)} loop(s) moved to archive.md")
+        sys.stdout.write(
+            "  swept: " + "\n  swept: ".join(loop.title for loop in swept)
+            + f"\n\n{len(swept)} loop(s) moved to archive.md\n"
+        )
 
 
 # -- cull ------------------------------------------------------------------
@@ -301,17 +353,18 @@ def cmd_cull(args: argparse.Namespace) -> None:
 
 def cmd_add_loop(args: argparse.Namespace) -> None:
     """Add a new loop to open.md."""
+    from datetime import date
+
     from adzekit.models import Loop
     from adzekit.modules.loops import add_loop
 
     settings = _resolve_settings(args)
-    due = date.fromisoformat(args.due) if args.due else None
     loop = Loop(
         date=date.today(),
         title=args.title,
         who=args.who or "",
         what=args.what or "",
-        due=due,
+        due=args.due,
         status="Open",
         next_action=args.next or "",
         project=args.project or "",
@@ -341,18 +394,30 @@ def cmd_tags(args: argparse.Namespace) -> None:
             print(f"No files tagged #{args.search.lstrip('#')}")
             return
         tag = args.search.lstrip("#").lower()
-        print(f"#{tag} ({len(files)} files):")
-        for f in files:
-            print(f"  {f.relative_to(settings.shed)}")
+        lines = [f"#{tag} ({len(files)} files):\n"]
+        lines.extend(f"  {f.relative_to(settings.shed)}\n" for f in files)
+        sys.stdout.write("".join(lines))
         return
 
     tags = all_tags(settings)
     if not tags:
         print("No tags found.")
         return
-    for tag in tags:
-        print(f"  #{tag}")
-    print(f"\n{len(tags)} tags")
+    _write_bytes(
+        b"".join(b"  #" + tag.encode("ascii") + b"\n" for tag in tags)
+        + f"\n{len(tags)} tags\n".encode()
+    )
+
+
+def _write_bytes(data: bytes) -> None:
+    """Write pre-encoded ASCII output, bypassing the text layer when possible."""
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        sys.stdout.write(data.decode())
+        return
+    sys.stdout.flush()
+    buffer.write(data)
+    buffer.flush()
 
 
 # -- project ---------------------------------------------------------------
@@ -458,16 +523,9 @@ def cmd_export(args: argparse.Namespace) -> None:
     from adzekit.modules.export import to_docx
 
     settings = _resolve_settings(args)
-    raw = Path(args.file)
     # Resolve relative paths against the shed root
-    source = raw if raw.is_absolute() else (settings.shed / raw)
-    source = source.expanduser().resolve()
-
-    output = None
-    if args.output:
-        raw_out = Path(args.output)
-        output = raw_out if raw_out.is_absolute() else (settings.shed / raw_out)
-        output = output.expanduser().resolve()
+    source = (settings.shed / args.file).resolve()
+    output = (settings.shed / args.output).resolve() if args.output else None
 
     docx_path = to_docx(source, output)
     print(f"Exported: {docx_path}")
@@ -486,21 +544,25 @@ def cmd_status(args: argparse.Namespace) -> None:
     wip = wip_status(settings)
     loops = loop_stats(settings)
 
-    print(f"Shed: {settings.shed}")
-    print(f"Active projects: {wip['active_projects']}/{wip['max_active_projects']}")
-    print(f"Daily tasks: {wip['daily_tasks']}/{wip['max_daily_tasks']}")
-    print(f"Active loops: {loops['active']}")
-    print(f"Overdue loops: {loops['overdue']}")
-    print(f"Approaching SLA: {loops['approaching_sla']}")
+    lines = [
+        f"Shed: {settings.shed}",
+        f"Active projects: {wip['active_projects']}/{wip['max_active_projects']}",
+        f"Daily tasks: {wip['daily_tasks']}/{wip['max_daily_tasks']}",
+        f"Active loops: {loops['active']}",
+        f"Overdue loops: {loops['overdue']}",
+        f"Approaching SLA: {loops['approaching_sla']}",
+    ]
 
     ages = project_ages(settings)
     if ages:
-        print("\nProject ages:")
+        lines.append("\nProject ages:")
         for a in ages:
             name = a.path.stem
             stale = f"{a.stale_days}d ago" if a.stale_days is not None else "untracked"
             created = f"{a.age_days}d old" if a.age_days is not None else ""
-            print(f"  {name}: modified {stale}" + (f", {created}" if created else ""))
+            lines.append(f"  {name}: modified {stale}" + (f", {created}" if created else ""))
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 # -- serve -----------------------------------------------------------------
@@ -538,7 +600,24 @@ def cmd_agent(args: argparse.Namespace) -> None:
     print(
         "Deprecated: `adzekit agent` is superseded by Claude Code.\n"
     )
-    import adzekit.agent.shed_tools  # noqa: F401
+    from adzekit.agent.client import create_client
+
+    # Builds the shared client up front, so a missing API key fails here
+    # before the tool modules and the orchestrator are imported.
+    create_client()
+
+    import importlib
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Tool registration and the orchestrator are independent imports; load
+    # them side by side so their file I/O overlaps.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = [
+            pool.submit(importlib.import_module, name)
+            for name in ("adzekit.agent.shed_tools", "adzekit.agent.orchestrator")
+        ]
+        for future in futures:
+            future.result()
     from adzekit.agent.orchestrator import run_agent
 
     print(f"Agent processing: {args.message}\n")
@@ -654,7 +733,7 @@ def cmd_set_shed(args: argparse.Namespace) -> None:
     """Persist the shed path to ~/.config/adzekit/config for all future sessions."""
     from adzekit.config import GLOBAL_CONFIG_PATH, set_global_shed
 
-    shed_path = Path(args.path).expanduser().resolve()
+    shed_path = args.path.resolve()
 
     if not shed_path.exists():
         print(f"Warning: {shed_path} does not exist yet. Creating config anyway.")
@@ -673,6 +752,13 @@ def cmd_set_shed(args: argparse.Namespace) -> None:
 # -- sync ------------------------------------------------------------------
 
 
+_SYNC_STEPS = (
+    ("pull", "Pulling stock/ and drafts/ from remote (stock is additive-only)...",
+     "sync_workbench"),
+    ("push", "Pushing stock/ and drafts/ to remote...", "push_workbench"),
+)
+
+
 def cmd_sync(args: argparse.Namespace) -> None:
     """Sync stock/ and drafts/ with the rclone remote, then refresh tag snippets."""
     from adzekit.modules.tags import generate_cursor_snippets
@@ -680,25 +766,14 @@ def cmd_sync(args: argparse.Namespace) -> None:
     settings = _resolve_settings(args)
 
     direction = getattr(args, "direction", None)
-
-    if direction in (None, "pull"):
-        print("Pulling stock/ and drafts/ from remote (stock is additive-only)...")
-        settings.sync_workbench()
-        if direction == "pull":
-            generate_cursor_snippets(settings)
-            print("Pull complete. Tag snippets refreshed.")
-            return
-
-    if direction in (None, "push"):
-        print("Pushing stock/ and drafts/ to remote...")
-        settings.push_workbench()
-        if direction == "push":
-            generate_cursor_snippets(settings)
-            print("Push complete. Tag snippets refreshed.")
-            return
+    for name, message, method in _SYNC_STEPS:
+        if direction in (None, name):
+            print(message)
+            getattr(settings, method)()
 
     generate_cursor_snippets(settings)
-    print("Sync complete (pull + push). Tag snippets refreshed.")
+    done = f"{direction.capitalize()} complete." if direction else "Sync complete (pull + push)."
+    print(f"{done} Tag snippets refreshed.")
 
 
 # -- setup-sync ------------------------------------------------------------
@@ -706,6 +781,9 @@ def cmd_sync(args: argparse.Namespace) -> None:
 
 def cmd_setup_sync(args: argparse.Namespace) -> None:
     """Guide the user through setting up rclone for Google Drive sync."""
+    import shutil
+    import subprocess
+
     settings = _resolve_settings(args)
 
     # Step 1: Check rclone is installed
@@ -721,9 +799,11 @@ def cmd_setup_sync(args: argparse.Namespace) -> None:
     # Step 2: Check if a remote named 'gdrive' already exists
     result = subprocess.run(
         ["rclone", "listremotes"],
-        capture_output=True, text=True,
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+    )
+    existing_remotes = frozenset(
+        line.removesuffix(b":").decode() for line in result.stdout.splitlines()
     )
-    existing_remotes = [r.rstrip(":") for r in result.stdout.strip().splitlines()]
 
     remote_name = args.remote or "gdrive"
 
@@ -755,263 +835,321 @@ def cmd_setup_sync(args: argparse.Namespace) -> None:
 # -- parser ----------------------------------------------------------------
 
 
-def build_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(
-        prog="adzekit",
-        description="AdzeKit -- prehistoric tools, modern brains.",
-    )
-    parser.add_argument(
-        "--shed",
-        help="Path to the shed (overrides ADZEKIT_SHED).",
-        default=None,
-    )
+def _iso_date(value: str):
+    """argparse type for YYYY-MM-DD dates."""
+    from datetime import date
+
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"invalid date (expected YYYY-MM-DD): {value!r}"
+        ) from None
 
-    sub = parser.add_subparsers(dest="command", required=True)
 
-    # adze
-    p_adze = sub.add_parser("adze", help="Print the AdzeKit symbol.")
-    p_adze.set_defaults(func=cmd_adze)
+def _user_path(value: str) -> "Path":
+    """argparse type for paths; expands ~ but does not resolve."""
+    from pathlib import Path
 
-    # init
-    p_init = sub.add_parser("init", help="Initialize a new shed.")
-    p_init.add_argument(
+    return Path(value).expanduser()
+
+
+def _add_init_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument(
         "path",
         nargs="?",
+        type=_user_path,
         default=None,
         help="Directory to initialize (default: current directory).",
     )
-    p_init.set_defaults(func=cmd_init)
 
-    # today
-    p_today = sub.add_parser("today", help="Create/show today's daily note.")
-    p_today.set_defaults(func=cmd_today)
 
-    # daily-start
-    p_ds = sub.add_parser(
-        "daily-start",
-        help="Bootstrap today's daily note from context.",
-    )
-    p_ds.add_argument(
-        "--date", default=None,
+def _add_target_date_arg(p: argparse.ArgumentParser) -> None:
+    p.add_argument(
+        "--date", type=_iso_date, default=None,
         help="Target date (YYYY-MM-DD, default: today).",
     )
-    p_ds.set_defaults(func=cmd_daily_start)
 
-    # daily-close
-    p_dc = sub.add_parser(
-        "daily-close",
-        help="Close today's note with reflection and sweep.",
-    )
-    p_dc.add_argument(
-        "--date", default=None,
-        help="Target date (YYYY-MM-DD, default: today).",
-    )
-    p_dc.set_defaults(func=cmd_daily_close)
 
-    # review
-    p_review = sub.add_parser("review", help="Create/show this week's review.")
-    p_review.add_argument(
+def _add_review_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument(
         "--date",
+        type=_iso_date,
         default=None,
         help="Date within the target week (YYYY-MM-DD, default: today).",
     )
-    p_review.set_defaults(func=cmd_review)
-
-    # sweep
-    p_sweep = sub.add_parser("sweep", help="Move [x] loops from active.md to archive.md.")
-    p_sweep.set_defaults(func=cmd_sweep)
-
-    # cull
-    p_cull = sub.add_parser("cull", help="Scan drafts/ and update bench with pending items.")
-    p_cull.set_defaults(func=cmd_cull)
-
-    # add-loop
-    p_loop = sub.add_parser("add-loop", help="Add a loop to open.md.")
-    p_loop.add_argument("title", help="Loop title.")
-    p_loop.add_argument("--size", default=None, help="T-shirt size (XS, S, M, L, XL).")
-    p_loop.add_argument("--who", default=None, help="Who is this commitment with?")
-    p_loop.add_argument("--what", default=None, help="What is the commitment?")
-    p_loop.add_argument("--due", default=None, help="Due date (YYYY-MM-DD).")
-    p_loop.add_argument("--next", default=None, help="Next action.")
-    p_loop.add_argument("--project", default=None, help="Project slug.")
-    p_loop.set_defaults(func=cmd_add_loop)
-
-    # project
-    p_project = sub.add_parser("project", help="Create a new project file.")
-    p_project.add_argument("slug", help="Project slug (e.g. acme-migration).")
-    p_project.add_argument(
+
+
+def _add_loop_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument("title", help="Loop title.")
+    p.add_argument("--size", default=None, help="T-shirt size (XS, S, M, L, XL).")
+    p.add_argument("--who", default=None, help="Who is this commitment with?")
+    p.add_argument("--what", default=None, help="What is the commitment?")
+    p.add_argument("--due", type=_iso_date, default=None, help="Due date (YYYY-MM-DD).")
+    p.add_argument("--next", default=None, help="Next action.")
+    p.add_argument("--project", default=None, help="Project slug.")
+
+
+def _add_project_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument("slug", help="Project slug (e.g. acme-migration).")
+    p.add_argument(
         "--title", default=None, help="Project title (default: slug).",
     )
-    p_project.add_argument(
+    p.add_argument(
         "--active", action="store_true",
         help="Create in active/ instead of backlog/.",
     )
-    p_project.set_defaults(func=cmd_project)
 
-    # demote
-    p_demote = sub.add_parser(
-        "demote", help="Move an active project back to backlog/.",
-    )
-    p_demote.add_argument("slug", help="Project slug.")
-    p_demote.set_defaults(func=cmd_demote)
 
-    # promote
-    p_promote = sub.add_parser(
-        "promote",
-        help="Move a backlog project to active/ (blocks at WIP cap).",
-    )
-    p_promote.add_argument("slug", help="Project slug.")
-    p_promote.set_defaults(func=cmd_promote)
+def _add_slug_arg(p: argparse.ArgumentParser) -> None:
+    p.add_argument("slug", help="Project slug.")
 
-    # status
-    p_status = sub.add_parser("status", help="Show shed health summary.")
-    p_status.set_defaults(func=cmd_status)
 
-    # poc-init
-    p_poc = sub.add_parser("poc-init", help="Generate a POC design document in stock/.")
-    p_poc.add_argument("slug", help="Project slug (e.g. acme-datamigration).")
-    p_poc.add_argument(
+def _add_poc_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument("slug", help="Project slug (e.g. acme-datamigration).")
+    p.add_argument(
         "--docx",
         action="store_true",
         help="Also export the generated template to .docx via pandoc.",
     )
-    p_poc.set_defaults(func=cmd_poc_init)
 
-    # export
-    p_export = sub.add_parser("export", help="Export a markdown file to docx.")
-    p_export.add_argument(
+
+def _add_export_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument(
         "file",
+        type=_user_path,
         help="Path to the markdown file (relative to shed root, or absolute).",
     )
-    p_export.add_argument(
+    p.add_argument(
         "-o", "--output",
+        type=_user_path,
         default=None,
         help="Output path, relative to shed or absolute (default: .docx extension).",
     )
-    p_export.set_defaults(func=cmd_export)
 
-    # sync
-    p_sync = sub.add_parser("sync", help="Sync stock/ and drafts/ via rclone.")
-    p_sync.add_argument(
+
+def _add_sync_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument(
         "direction",
         nargs="?",
         choices=["pull", "push"],
         default=None,
         help="Sync direction (default: pull then push).",
     )
-    p_sync.set_defaults(func=cmd_sync)
 
-    # setup-sync
-    p_setup = sub.add_parser("setup-sync", help="Configure rclone for Google Drive sync.")
-    p_setup.add_argument(
+
+def _add_setup_sync_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument(
         "--remote",
         default=None,
         help="rclone remote name (default: gdrive).",
     )
-    p_setup.add_argument(
+    p.add_argument(
         "--folder",
         default=None,
         help="Folder path on the remote (default: adzekit).",
     )
-    p_setup.set_defaults(func=cmd_setup_sync)
 
-    # serve
-    p_serve = sub.add_parser("serve", help="Start the local web UI.")
-    p_serve.add_argument(
+
+def _add_serve_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument(
         "--port", type=int, default=8742,
         help="Port to serve on (default: 8742).",
     )
-    p_serve.add_argument(
+    p.add_argument(
         "--host", default="127.0.0.1",
         help="Host to bind to (default: 127.0.0.1).",
     )
-    p_serve.set_defaults(func=cmd_serve)
 
-    # set-shed
-    p_set_shed = sub.add_parser(
-        "set-shed",
-        help="Set the global shed path (persists across sessions and terminal resets).",
-    )
-    p_set_shed.add_argument(
+
+def _add_set_shed_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument(
         "path",
+        type=_user_path,
         help="Path to the AdzeKit shed (e.g. ~/Repos/adzekit-workspace).",
     )
-    p_set_shed.set_defaults(func=cmd_set_shed)
 
-    # agent
-    p_agent = sub.add_parser("agent", help="Run the agent with a one-shot message.")
-    p_agent.add_argument("message", help="Message to send to the agent.")
-    p_agent.set_defaults(func=cmd_agent)
 
-    # graph
-    p_graph = sub.add_parser("graph", help="Knowledge graph operations.")
-    p_graph.set_defaults(func=cmd_graph, graph_command=None)
-    graph_sub = p_graph.add_subparsers(dest="graph_command")
+def _add_agent_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument("message", help="Message to send to the agent.")
+
+
+def _add_graph_args(p: argparse.ArgumentParser) -> None:
+    p.set_defaults(graph_command=None)
+    graph_sub = p.add_subparsers(dest="graph_command")
 
-    p_graph_build = graph_sub.add_parser("build", help="Build knowledge graph from shed content.")
-    p_graph_build.set_defaults(func=cmd_graph, graph_command="build")
+    p_build = graph_sub.add_parser("build", help="Build knowledge graph from shed content.")
+    p_build.set_defaults(func=cmd_graph, graph_command="build")
 
-    p_graph_query = graph_sub.add_parser("query", help="Query graph context for an entity.")
-    p_graph_query.add_argument("entity", help="Entity name (slug, e.g. vector-search).")
-    p_graph_query.add_argument(
+    p_query = graph_sub.add_parser("query", help="Query graph context for an entity.")
+    p_query.add_argument("entity", help="Entity name (slug, e.g. vector-search).")
+    p_query.add_argument(
         "--depth", type=int, default=2,
         help="Traversal depth (default: 2).",
     )
-    p_graph_query.set_defaults(func=cmd_graph, graph_command="query")
+    p_query.set_defaults(func=cmd_graph, graph_command="query")
 
-    p_graph_stats = graph_sub.add_parser("stats", help="Show graph statistics.")
-    p_graph_stats.set_defaults(func=cmd_graph, graph_command="stats")
+    p_stats = graph_sub.add_parser("stats", help="Show graph statistics.")
+    p_stats.set_defaults(func=cmd_graph, graph_command="stats")
 
-    p_graph_orphans = graph_sub.add_parser("orphans", help="List entities with no connections.")
-    p_graph_orphans.set_defaults(func=cmd_graph, graph_command="orphans")
+    p_orphans = graph_sub.add_parser("orphans", help="List entities with no connections.")
+    p_orphans.set_defaults(func=cmd_graph, graph_command="orphans")
 
-    # tags
-    p_tags = sub.add_parser("tags", help="List, search, or autocomplete tags.")
-    p_tags.add_argument(
+
+def _add_tags_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument(
         "search",
         nargs="?",
         default=None,
         help="Tag to search for (e.g. vector-search).",
     )
-    p_tags.add_argument(
+    p.add_argument(
         "--completions",
         action="store_true",
         help="Generate .vscode/adzekit.code-snippets for Cursor autocomplete.",
     )
-    p_tags.set_defaults(func=cmd_tags)
 
-    # prune-drafts
-    p_pd = sub.add_parser("prune-drafts", help="Delete stale draft files.")
-    p_pd.add_argument(
+
+def _add_prune_drafts_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument(
         "--days", type=int, default=None,
         help="Delete files older than N days (default: from config or 7).",
     )
-    p_pd.set_defaults(func=cmd_prune_drafts)
 
-    # automate
-    p_auto = sub.add_parser(
-        "automate", help="Install/uninstall launchd automation.",
-    )
-    p_auto.add_argument(
+
+def _add_automate_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument(
         "action", choices=["install", "uninstall"],
         help="install or uninstall launchd plists.",
     )
-    p_auto.set_defaults(func=cmd_automate)
+
+
+# (name, help, handler, argument adder) for each subcommand, in help order.
+_COMMANDS: tuple[
+    tuple[str, str, Callable[[argparse.Namespace], None],
+          Callable[[argparse.ArgumentParser], None] | None], ...
+] = (
+    ("adze", "Print the AdzeKit symbol.", cmd_adze, None),
+    ("init", "Initialize a new shed.", cmd_init, _add_init_args),
+    ("today", "Create/show today's daily note.", cmd_today, None),
+    ("daily-start", "Bootstrap today's daily note from context.",
+     cmd_daily_start, _add_target_date_arg),
+    ("daily-close", "Close today's note with reflection and sweep.",
+     cmd_daily_close, _add_target_date_arg),
+    ("review", "Create/show this week's review.", cmd_review, _add_review_args),
+    ("sweep", "Move [x] loops from active.md to archive.md.", cmd_sweep, None),
+    ("cull", "Scan drafts/ and update bench with pending items.", cmd_cull, None),
+    ("add-loop", "Add a loop to open.md.", cmd_add_loop, _add_loop_args),
+    ("project", "Create a new project file.", cmd_project, _add_project_args),
+    ("demote", "Move an active project back to backlog/.", cmd_demote, _add_slug_arg),
+    ("promote", "Move a backlog project to active/ (blocks at WIP cap).",
+     cmd_promote, _add_slug_arg),
+    ("status", "Show shed health summary.", cmd_status, None),
+    ("poc-init", "Generate a POC design document in stock/.", cmd_poc_init, _add_poc_args),
+    ("export", "Export a markdown file to docx.", cmd_export, _add_export_args),
+    ("sync", "Sync stock/ and drafts/ via rclone.", cmd_sync, _add_sync_args),
+    ("setup-sync", "Configure rclone for Google Drive sync.",
+     cmd_setup_sync, _add_setup_sync_args),
+    ("serve", "Start the local web UI.", cmd_serve, _add_serve_args),
+    ("set-shed", "Set the global shed path (persists across sessions and terminal resets).",
+     cmd_set_shed, _add_set_shed_args),
+    ("agent", "Run the agent with a one-shot message.", cmd_agent, _add_agent_args),
+    ("graph", "Knowledge graph operations.", cmd_graph, _add_graph_args),
+    ("tags", "List, search, or autocomplete tags.", cmd_tags, _add_tags_args),
+    ("prune-drafts", "Delete stale draft files.", cmd_prune_drafts, _add_prune_drafts_args),
+    ("automate", "Install/uninstall launchd automation.", cmd_automate, _add_automate_args),
+)
+
+
+_COMMAND_NAMES = frozenset(c[0] for c in _COMMANDS)
+# Commands without arguments of their own, dispatched without argparse.
+_BARE_COMMANDS = {name: func for name, _, func, add_args in _COMMANDS if add_args is None}
+
+
+@functools.lru_cache(maxsize=None)
+def build_parser(command: str | None = None) -> argparse.ArgumentParser:
+    """Build the CLI parser, cached per ``command``.
+
+    With ``command`` set, only that subcommand's parser is registered; the
+    full tree is built only for top-level help and usage errors. Returned
+    parsers are shared between calls and must not be mutated.
+    """
+    parser = argparse.ArgumentParser(
+        prog="adzekit",
+        description="AdzeKit -- prehistoric tools, modern brains.",
+    )
+    parser.add_argument(
+        "--shed",
+        type=_user_path,
+        help="Path to the shed (overrides ADZEKIT_SHED).",
+        default=None,
+    )
+    parser.add_argument(
+        "--version",
+        action="version",
+        version=f"%(prog)s {__version__}",
+    )
+
+    sub = parser.add_subparsers(dest="command", required=True)
+    for name, help_text, func, add_args in _COMMANDS:
+        if command is not None and name != command:
+            continue
+        p = sub.add_parser(name, help=help_text)
+        if add_args is not None:
+            add_args(p)
+        p.set_defaults(func=func)
 
     return parser
 
 
+def _command_in(argv: list[str]) -> str | None:
+    """Return the subcommand named in ``argv``, or None if there isn't one.
+
+    Stops at the first positional; ``--shed`` is the only top-level option
+    that takes a separate value.
+    """
+    it = iter(argv)
+    for arg in it:
+        if arg == "--shed":
+            next(it, None)
+        elif not arg.startswith("-"):
+            return arg if arg in _COMMAND_NAMES else None
+    return None
+
+
+def _bare_args(argv: list[str]) -> argparse.Namespace | None:
+    """Namespace for ``[--shed PATH] <bare command>``, or None if argv is anything else.
+
+    Anything unusual (help, unknown options, extra arguments) returns None
+    so argparse handles it and produces its usual messages.
+    """
+    shed = None
+    rest = argv
+    if rest and rest[0] == "--shed" and len(rest) > 1:
+        shed, rest = _user_path(rest[1]), rest[2:]
+    elif rest and rest[0].startswith("--shed="):
+        shed, rest = _user_path(rest[0].partition("=")[2]), rest[1:]
+    if len(rest) != 1 or rest[0] not in _BARE_COMMANDS:
+        return None
+    return argparse.Namespace(shed=shed, command=rest[0], func=_BARE_COMMANDS[rest[0]])
+
+
 def main(argv: list[str] | None = None) -> None:
-    from adzekit.config import ShedNotInitializedError
+    if argv is None:
+        argv = sys.argv[1:]
+    # Fast path: the banner needs neither the parser nor any adzekit module.
+    if argv == ["adze"]:
+        cmd_adze(None)
+        return
 
-    parser = build_parser()
-    args = parser.parse_args(argv)
+    args = _bare_args(argv)
+    if args is None:
+        args = build_parser(_command_in(argv)).parse_args(argv)
     try:
         args.func(args)
-    except ShedNotInitializedError as exc:
-        print(f"Error: {exc}", file=sys.stderr)
-        raise SystemExit(1)
     except (ValueError, RuntimeError) as exc:
+        # Also covers ShedNotInitializedError (a RuntimeError), so --help and
+        # --version exit from parse_args without importing adzekit.config.
         print(f"Error: {exc}", file=sys.stderr)
         raise SystemExit(1)
 
@@ -61,7 +61,7 @@ class RelationType(str, Enum):
     EXTENDS = "extends"
 
 
-@dataclass
+@dataclass(slots=True)
 class Entity:
     """A node in the knowledge graph."""
 
@@ -70,7 +70,7 @@ class Entity:
     sources: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Relationship:
     """A typed directed edge in the knowledge graph."""
 
@@ -80,7 +80,7 @@ class Relationship:
     source_file: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class KnowledgeGraph:
     """In-memory knowledge graph for a shed."""
 
@@ -94,7 +94,7 @@ class LoopStatus(str, Enum):
     CLOSED = "closed"
 
 
-@dataclass
+@dataclass(slots=True)
 class Loop:
     """A commitment to another person requiring closure."""
 
@@ -115,7 +115,7 @@ class ProjectState(str, Enum):
     ARCHIVE = "archive"
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """A single checklist item."""
 
@@ -123,7 +123,7 @@ class Task:
     done: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class Project:
     """A single project markdown file parsed into structured data."""
 
@@ -133,14 +133,18 @@ class Project:
     tasks: list[Task] = field(default_factory=list)
     raw_content: str = ""
 
+    @property
+    def done_count(self) -> int:
+        return sum(1 for t in self.tasks if t.done)
+
     @property
     def progress(self) -> float:
         if not self.tasks:
             return 0.0
-        return sum(1 for t in self.tasks if t.done) / len(self.tasks)
+        return self.done_count / len(self.tasks)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LogEntry:
     """A timestamped log entry from the daily note."""
 
@@ -148,7 +152,7 @@ class LogEntry:
     text: str
 
 
-@dataclass
+@dataclass(slots=True)
 class DailyNote:
     """A single day's note with morning intentions, log, and reflection."""
 
@@ -5,27 +5,38 @@ custom reference document styled with DM Sans. Requires pandoc to
 be installed and available on PATH.
 """
 
+import copy
+import functools
+import hashlib
+import os
 import shutil
 import subprocess
+import zipfile
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from docx import Document
-from docx.oxml import parse_xml
-from docx.oxml.ns import nsdecls, qn
-from docx.shared import Pt, RGBColor
+# python-docx (and lxml under it) is imported inside the functions that use
+# it, so importing this module stays cheap until an export actually runs.
+if TYPE_CHECKING:
+    from docx.document import Document
 
 # ---------------------------------------------------------------------------
-# Locate bundled assets shipped inside the package
+# Cache directory for generated files (kept out of the package tree)
 # ---------------------------------------------------------------------------
 
-def _assets_dir() -> Path:
-    """Return the path to the package's assets directory."""
-    return Path(__file__).resolve().parents[3] / "assets"
+def _cache_dir() -> Path:
+    """Return AdzeKit's cache directory ($XDG_CACHE_HOME/adzekit), creating it."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    path = Path(base) / "adzekit"
+    path.mkdir(parents=True, exist_ok=True)
+    return path
 
 
 # Font configuration
 _FONT_NAME = "DM Sans"
-_FONT_COLOR = RGBColor(0x1A, 0x1A, 0x1A)
+_FONT_COLOR = (0x1A, 0x1A, 0x1A)  # RGB
+# Heading level -> point size
+_HEADING_SIZES = {1: 18, 2: 14, 3: 12, 4: 11}
 
 
 # ---------------------------------------------------------------------------
@@ -39,6 +50,10 @@ def _build_reference_doc(ref_path: Path) -> Path:
     generated docx.  We build one programmatically so there is no
     opaque binary blob checked into the repo.
     """
+    from docx import Document
+    from docx.shared import Pt, RGBColor
+
+    color = RGBColor(*_FONT_COLOR)
     doc = Document()
 
     # Remove all default section breaks -- single continuous section
@@ -49,7 +64,7 @@ def _build_reference_doc(ref_path: Path) -> Path:
     for style in doc.styles:
         if hasattr(style, "font") and style.font is not None:
             style.font.name = _FONT_NAME
-            style.font.color.rgb = _FONT_COLOR
+            style.font.color.rgb = color
 
         if hasattr(style, "paragraph_format"):
             pf = style.paragraph_format
@@ -57,14 +72,13 @@ def _build_reference_doc(ref_path: Path) -> Path:
             pf.space_after = Pt(4)
 
     # Heading styles -- clean, tight spacing
-    sizes = {1: 18, 2: 14, 3: 12, 4: 11}
-    for level, size in sizes.items():
+    for level, size in _HEADING_SIZES.items():
         name = f"Heading {level}"
         if name in doc.styles:
             s = doc.styles[name]
             s.font.bold = True
             s.font.size = Pt(size)
-            s.font.color.rgb = _FONT_COLOR
+            s.font.color.rgb = color
             s.paragraph_format.space_before = Pt(10 if level == 1 else 8)
             s.paragraph_format.space_after = Pt(2)
             s.paragraph_format.line_spacing = 1.0
@@ -80,11 +94,41 @@ def _build_reference_doc(ref_path: Path) -> Path:
     return ref_path
 
 
+def _reference_key() -> str:
+    """Hash of everything that shapes reference.docx.
+
+    Covers the font and size constants and the builder's own code, so
+    editing either produces a new key and a rebuild.
+    """
+    code = _build_reference_doc.__code__
+    h = hashlib.sha1()
+    h.update(repr((_FONT_NAME, _FONT_COLOR, _HEADING_SIZES, code.co_consts)).encode())
+    h.update(code.co_code)
+    return h.hexdigest()[:12]
+
+
 def _get_reference_doc() -> Path:
-    """Return path to the cached reference.docx, building it if needed."""
-    ref = _assets_dir() / "reference.docx"
-    # Always rebuild so style changes take effect
-    _build_reference_doc(ref)
+    """Return path to the cached reference.docx, building it if needed.
+
+    The build is skipped when the sibling ``reference.docx.key`` matches
+    the current style key, and the result is memoized per process. The
+    key covers the builder's code, so style edits rebuild without a switch.
+    """
+    return _cached_reference_doc()
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_reference_doc() -> Path:
+    ref = _cache_dir() / "reference.docx"
+    key_file = ref.with_name(ref.name + ".key")
+    key = _reference_key()
+    try:
+        current = ref.exists() and key_file.read_text(encoding="utf-8") == key
+    except FileNotFoundError:
+        current = False
+    if not current:
+        _build_reference_doc(ref)
+        key_file.write_text(key, encoding="utf-8")
     return ref
 
 
@@ -92,18 +136,37 @@ def _get_reference_doc() -> Path:
 # Post-processing: table borders and section break removal
 # ---------------------------------------------------------------------------
 
-_BORDER_XML = (
-    '<w:tcBorders %s>'
-    '  <w:top w:val="single" w:sz="4" w:space="0" w:color="BFBFBF"/>'
-    '  <w:left w:val="single" w:sz="4" w:space="0" w:color="BFBFBF"/>'
-    '  <w:bottom w:val="single" w:sz="4" w:space="0" w:color="BFBFBF"/>'
-    '  <w:right w:val="single" w:sz="4" w:space="0" w:color="BFBFBF"/>'
-    '</w:tcBorders>'
-) % nsdecls("w")
+_BORDER_ATTRS = 'w:val="single" w:sz="4" w:space="0" w:color="BFBFBF"'
+
+@functools.lru_cache(maxsize=1)
+def _border_elements() -> tuple:
+    """(tblBorders, tcBorders) elements, parsed once; callers append deepcopies."""
+    from docx.oxml import parse_xml
+    from docx.oxml.ns import nsdecls
+
+    table = parse_xml(
+        f'<w:tblBorders {nsdecls("w")}>'
+        + "".join(
+            f"<w:{edge} {_BORDER_ATTRS}/>"
+            for edge in ("top", "left", "bottom", "right", "insideH", "insideV")
+        )
+        + "</w:tblBorders>"
+    )
+    cell = parse_xml(
+        f'<w:tcBorders {nsdecls("w")}>'
+        + "".join(f"<w:{edge} {_BORDER_ATTRS}/>" for edge in ("top", "left", "bottom", "right"))
+        + "</w:tcBorders>"
+    )
+    return table, cell
 
 
-def _style_tables(doc: Document) -> None:
+def _style_tables(doc: "Document") -> None:
     """Add clean borders to every cell in every table."""
+    from docx.oxml import parse_xml
+    from docx.oxml.ns import nsdecls, qn
+    from docx.shared import Pt
+
+    table_borders, cell_borders = _border_elements()
     for table in doc.tables:
         # Remove any table-level style that pandoc may have applied
         tbl = table._tbl
@@ -113,16 +176,7 @@ def _style_tables(doc: Document) -> None:
             tbl.insert(0, tbl_pr)
 
         # Set table-level borders
-        borders_el = parse_xml(
-            f'<w:tblBorders {nsdecls("w")}>'
-            '  <w:top w:val="single" w:sz="4" w:space="0" w:color="BFBFBF"/>'
-            '  <w:left w:val="single" w:sz="4" w:space="0" w:color="BFBFBF"/>'
-            '  <w:bottom w:val="single" w:sz="4" w:space="0" w:color="BFBFBF"/>'
-            '  <w:right w:val="single" w:sz="4" w:space="0" w:color="BFBFBF"/>'
-            '  <w:insideH w:val="single" w:sz="4" w:space="0" w:color="BFBFBF"/>'
-            '  <w:insideV w:val="single" w:sz="4" w:space="0" w:color="BFBFBF"/>'
-            "</w:tblBorders>"
-        )
+        borders_el = copy.deepcopy(table_borders)
         # Remove existing borders if any
         existing = tbl_pr.find(qn("w:tblBorders"))
         if existing is not None:
@@ -136,7 +190,7 @@ def _style_tables(doc: Document) -> None:
                 existing_borders = tc_pr.find(qn("w:tcBorders"))
                 if existing_borders is not None:
                     tc_pr.remove(existing_borders)
-                tc_pr.append(parse_xml(_BORDER_XML))
+                tc_pr.append(copy.deepcopy(cell_borders))
 
                 # Set cell font
                 for para in cell.paragraphs:
@@ -145,8 +199,11 @@ def _style_tables(doc: Document) -> None:
                         run.font.size = Pt(9)
 
 
-def _remove_section_breaks(doc: Document) -> None:
+def _remove_section_breaks(doc: "Document") -> None:
     """Convert all section breaks to continuous so the doc flows."""
+    from docx.oxml import parse_xml
+    from docx.oxml.ns import nsdecls, qn
+
     for section in doc.sections:
         sectPr = section._sectPr
         sect_type = sectPr.find(qn("w:type"))
@@ -158,8 +215,22 @@ def _remove_section_breaks(doc: Document) -> None:
             )
 
 
+def _needs_postprocess(docx_path: Path) -> bool:
+    """True unless the docx has no tables and a single section.
+
+    Checked on the raw document.xml bytes, which is far cheaper than
+    loading the package with python-docx. The start type of a lone
+    section has no visible effect, so there is nothing to rewrite.
+    """
+    with zipfile.ZipFile(docx_path) as zf:
+        data = zf.read("word/document.xml")
+    return b"<w:tbl>" in data or b"<w:tbl " in data or data.count(b"<w:sectPr") > 1
+
+
 def _postprocess(docx_path: Path) -> None:
     """Apply table borders and remove section breaks from a docx."""
+    from docx import Document
+
     doc = Document(str(docx_path))
     _style_tables(doc)
     _remove_section_breaks(doc)
@@ -210,6 +281,7 @@ def to_docx(source: Path, output: Path | None = None) -> Path:
         text=True,
     )
 
-    _postprocess(output)
+    if _needs_postprocess(output):
+        _postprocess(output)
 
     return output
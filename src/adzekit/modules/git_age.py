@@ -4,35 +4,43 @@ Uses git history to determine when files were created and last modified,
 without requiring any embedded metadata or frontmatter.
 """
 
+import os
 import subprocess
-from dataclasses import dataclass
-from datetime import date, datetime
+from dataclasses import dataclass, field
+from datetime import date
 from pathlib import Path
 
 from adzekit.config import Settings, get_settings
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FileAge:
     """Git-derived timestamps for a single file."""
 
     path: Path
     created: date | None = None
     modified: date | None = None
+    # Reference day for age_days/stale_days; None means date.today().
+    as_of: date | None = field(default=None, repr=False, compare=False)
 
     @property
     def age_days(self) -> int | None:
         """Days since the file was created."""
         if self.created is None:
             return None
-        return (date.today() - self.created).days
+        return ((self.as_of or date.today()) - self.created).days
 
     @property
     def stale_days(self) -> int | None:
         """Days since the file was last modified."""
         if self.modified is None:
             return None
-        return (date.today() - self.modified).days
+        return ((self.as_of or date.today()) - self.modified).days
+
+
+def _iso_day(stamp: str) -> date:
+    """Date part of a git ``%aI`` stamp (YYYY-MM-DDTHH:MM:SS+HH:MM), in its own zone."""
+    return date(int(stamp[0:4]), int(stamp[5:7]), int(stamp[8:10]))
 
 
 def _git_date(args: list[str], cwd: Path) -> date | None:
@@ -48,7 +56,7 @@ def _git_date(args: list[str], cwd: Path) -> date | None:
         output = result.stdout.strip()
         if not output:
             return None
-        return datetime.fromisoformat(output).date()
+        return _iso_day(output)
     except (subprocess.CalledProcessError, ValueError):
         return None
 
@@ -70,14 +78,83 @@ def file_age(path: Path, settings: Settings | None = None) -> FileAge:
     return FileAge(path=path, created=created, modified=modified)
 
 
+# Prefix marking the date line of each commit in _all_file_dates' log output.
+_COMMIT_MARK = "\x1e"
+
+
+def _all_file_dates(
+    cwd: Path, paths: set[str]
+) -> dict[str, tuple[date | None, date]]:
+    """Map each of ``paths`` (relative to cwd) to its (created, modified) dates.
+
+    One ``git log -M --name-status`` walk replaces two ``git log`` runs per
+    file. Modified is the newest commit touching the path. Created is the
+    commit that added it, following renames back to older paths the way
+    file_age()'s ``--follow`` does, so moving a project between
+    directories keeps its creation date.
+    """
+    if not paths:
+        return {}
+    try:
+        result = subprocess.run(
+            ["git", "-c", "core.quotepath=off", "log", "-M", "--name-status",
+             "--relative", f"--format={_COMMIT_MARK}%aI"],
+            cwd=cwd,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except subprocess.CalledProcessError:
+        return {}
+
+    # Path each file had at the point of history being read -> current path.
+    # Newest commits come first, so a rename maps the new name back to the old.
+    lineage = {p: p for p in paths}
+    created: dict[str, date] = {}
+    modified: dict[str, date] = {}
+    current: date | None = None
+    for line in result.stdout.split("\n"):  # not splitlines(): it splits on \x1e
+        if line.startswith(_COMMIT_MARK):
+            current = _iso_day(line[1:])
+            continue
+        if not line or current is None:
+            continue
+        status, *names = line.split("\t")
+        target = lineage.get(names[-1])
+        if target is None:
+            continue
+        modified.setdefault(target, current)
+        if status.startswith("R"):
+            del lineage[names[-1]]
+            lineage[names[0]] = target
+        elif status == "A":
+            del lineage[names[-1]]
+            created.setdefault(target, current)
+    return {p: (created.get(p), modified[p]) for p in modified}
+
+
 def project_ages(settings: Settings | None = None) -> list[FileAge]:
     """Get ages for all project files, sorted oldest-modified first."""
     settings = settings or get_settings()
-    ages = []
+    cwd = settings.shed
+    files = []
     for d in [settings.active_dir, settings.backlog_dir]:
-        if not d.exists():
+        try:
+            with os.scandir(d) as it:
+                names = sorted(
+                    e.name for e in it
+                    if e.name.endswith(".md") and e.is_file()
+                )
+        except FileNotFoundError:
             continue
-        for f in sorted(d.glob("*.md")):
-            ages.append(file_age(f, settings))
+        files.extend(d / name for name in names)
+
+    today = date.today()
+    rels = {f: str(f.relative_to(cwd)) for f in files}
+    dates = _all_file_dates(cwd, set(rels.values()))
+    ages = []
+    for f in files:
+        created, modified = dates.get(rels[f], (None, None))
+        ages.append(FileAge(path=f, created=created, modified=modified, as_of=today))
     ages.sort(key=lambda a: a.stale_days or 0, reverse=True)
     return ages
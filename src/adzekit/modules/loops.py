@@ -13,6 +13,7 @@ Loops mirror the project lifecycle: active / backlog / archive.
 
 from __future__ import annotations
 
+import os
 from datetime import date, timedelta
 from pathlib import Path
 
@@ -28,6 +29,21 @@ def _atomic_write(path: Path, content: str) -> None:
     tmp.rename(path)
 
 
+def _append_lines(path: Path, text: str, header: str = "") -> None:
+    """Append ``text`` to path without rewriting what is already there.
+
+    A new (or empty) file gets ``header`` first; an existing file that does
+    not end in a newline gets one before ``text``.
+    """
+    with path.open("ab+") as f:
+        if f.tell() == 0:
+            prefix = header
+        else:
+            f.seek(-1, os.SEEK_END)
+            prefix = "" if f.read(1) == b"\n" else "\n"
+        f.write((prefix + text).encode("utf-8"))
+
+
 def _loops_match(a: Loop, b: Loop) -> bool:
     """Match loops by title + creation date (not title alone)."""
     return a.title == b.title and a.date == b.date
@@ -124,12 +140,11 @@ def close_loop(
     today = date.today()
     week_num = today.isocalendar()[1]
     archive_file = settings.loops_archive_dir / f"{today.year}-W{week_num:02d}.md"
-    if archive_file.exists():
-        existing = archive_file.read_text(encoding="utf-8")
-    else:
-        existing = f"# Archived Loops -- {today.year} Week {week_num}\n\n"
-    existing += format_loop(to_close)
-    _atomic_write(archive_file, existing)
+    _append_lines(
+        archive_file,
+        format_loop(to_close) + "\n",
+        header=f"# Archived Loops -- {today.year} Week {week_num}\n\n",
+    )
 
     return True
 
@@ -157,35 +172,63 @@ def sweep_closed(settings: Settings | None = None) -> list[Loop]:
         return []
 
     active_content = "# Active Loops\n\n" + format_loops(still_active) + "\n"
-    archive_path = settings.loops_dir / "archive.md"
-
-    if archive_path.exists():
-        archive_existing = archive_path.read_text(encoding="utf-8").rstrip()
-    else:
-        archive_existing = "# Archived Loops"
-    archive_content = archive_existing + "\n" + format_loops(swept) + "\n"
-
     _atomic_write(settings.loops_active, active_content)
-    _atomic_write(archive_path, archive_content)
+    _append_lines(
+        settings.loops_dir / "archive.md",
+        format_loops(swept) + "\n",
+        header="# Archived Loops\n",
+    )
 
     return swept
 
 
-def get_overdue_loops(settings: Settings | None = None) -> list[Loop]:
-    """Return active loops that are past their due date."""
-    settings = settings or get_settings()
+def _classify_dates(settings: Settings) -> tuple[date, date]:
+    """Return (today, SLA cutoff) for _classify."""
     today = date.today()
-    return [loop for loop in get_active_loops(settings) if loop.due and loop.due < today]
+    return today, today - timedelta(hours=settings.loop_sla_hours)
 
 
-def get_approaching_sla(settings: Settings | None = None) -> list[Loop]:
-    """Return active loops nearing the 24-hour SLA window."""
+def _classify(
+    loops: list[Loop], today: date, cutoff: date
+) -> tuple[list[Loop], list[Loop]]:
+    """Split loops into (overdue, approaching SLA) in a single pass."""
+    overdue: list[Loop] = []
+    approaching: list[Loop] = []
+    for loop in loops:
+        due = loop.due
+        if due and due < today:
+            overdue.append(loop)
+        if loop.date <= cutoff and loop.status.lower() != "closed":
+            approaching.append(loop)
+    return overdue, approaching
+
+
+def get_overdue_loops(
+    settings: Settings | None = None, loops: list[Loop] | None = None
+) -> list[Loop]:
+    """Return active loops that are past their due date.
+
+    Pass ``loops`` to filter an already-read active list instead of
+    re-reading active.md.
+    """
+    settings = settings or get_settings()
+    if loops is None:
+        loops = get_active_loops(settings)
+    return _classify(loops, *_classify_dates(settings))[0]
+
+
+def get_approaching_sla(
+    settings: Settings | None = None, loops: list[Loop] | None = None
+) -> list[Loop]:
+    """Return active loops nearing the 24-hour SLA window.
+
+    Pass ``loops`` to filter an already-read active list instead of
+    re-reading active.md.
+    """
     settings = settings or get_settings()
-    cutoff = date.today() - timedelta(hours=settings.loop_sla_hours)
-    return [
-        loop for loop in get_active_loops(settings)
-        if loop.date <= cutoff and loop.status.lower() != "closed"
-    ]
+    if loops is None:
+        loops = get_active_loops(settings)
+    return _classify(loops, *_classify_dates(settings))[1]
 
 
 def loop_stats(settings: Settings | None = None) -> dict:
@@ -193,8 +236,7 @@ def loop_stats(settings: Settings | None = None) -> dict:
     settings = settings or get_settings()
     active = get_active_loops(settings)
     backlog = get_backlog_loops(settings)
-    overdue = get_overdue_loops(settings)
-    approaching = get_approaching_sla(settings)
+    overdue, approaching = _classify(active, *_classify_dates(settings))
     return {
         "active": len(active),
         "backlog": len(backlog),
@@ -6,6 +6,7 @@ context are pre-filled. Everything else is left blank for the human
 or LLM to complete.
 """
 
+import string
 from datetime import date
 from pathlib import Path
 
@@ -88,6 +89,23 @@ This works if both sides commit. Here's what each side owns.
 """
 
 
+# POC_TEMPLATE split once into (literal, field name) pairs so rendering is a
+# join instead of re-parsing the template on every call.
+_POC_PARTS = [(lit, name) for lit, name, _, _ in string.Formatter().parse(POC_TEMPLATE)]
+
+
+def _render_poc(**fields: str) -> str:
+    """Fill POC_TEMPLATE; equivalent to POC_TEMPLATE.format(**fields)."""
+    return "".join(
+        lit + fields[name] if name is not None else lit for lit, name in _POC_PARTS
+    )
+
+
+# Section headings whose body _extract_project_fields reads; any other
+# "## " heading ends the current section.
+_SECTIONS = {"## context": "context", "## log": "log", "## notes": "notes"}
+
+
 def _find_project(slug: str, settings: Settings) -> Path | None:
     """Search for a project markdown file by slug across all project dirs."""
     candidates = [
@@ -104,9 +122,6 @@ def _find_project(slug: str, settings: Settings) -> Path | None:
 
 def _extract_project_fields(project_path: Path) -> dict[str, str]:
     """Pull title and context from a project markdown file."""
-    text = project_path.read_text(encoding="utf-8")
-    lines = text.split("\n")
-
     title = project_path.stem
     context = ""
     tasks: list[str] = []
@@ -114,35 +129,26 @@ def _extract_project_fields(project_path: Path) -> dict[str, str]:
     section = ""
     context_lines: list[str] = []
 
-    for line in lines:
-        stripped = line.strip()
-
-        if stripped.startswith("# ") and not stripped.startswith("## "):
-            raw_title = stripped.lstrip("# ").strip()
-            title = (
-                " ".join(w for w in raw_title.split() if not w.startswith("#")).strip()
-                or raw_title
-            )
-            continue
-
-        lower = stripped.lower()
-        if lower == "## context":
-            section = "context"
-            continue
-        elif lower == "## log":
-            section = "log"
-            continue
-        elif lower == "## notes":
-            section = "notes"
-            continue
-        elif stripped.startswith("## "):
-            section = ""
-            continue
-
-        if section == "context" and stripped:
-            context_lines.append(stripped)
-        elif section == "log" and stripped:
-            tasks.append(stripped)
+    with project_path.open(encoding="utf-8") as f:
+        for line in f:
+            stripped = line.strip()
+
+            if stripped[:3] == "## ":
+                section = _SECTIONS.get(stripped.lower(), "")
+                continue
+
+            if stripped[:2] == "# ":
+                raw_title = stripped.lstrip("# ").strip()
+                title = (
+                    " ".join(w for w in raw_title.split() if not w.startswith("#")).strip()
+                    or raw_title
+                )
+                continue
+
+            if section == "context" and stripped:
+                context_lines.append(stripped)
+            elif section == "log" and stripped:
+                tasks.append(stripped)
 
     if context_lines:
         context = "\n".join(context_lines)
@@ -181,7 +187,7 @@ def generate_poc(
     else:
         tasks_str = "- [ ]\n- [ ]\n- [ ]"
 
-    content = POC_TEMPLATE.format(
+    content = _render_poc(
         title=fields["title"],
         date_created=date.today().isoformat(),
         context=fields["context"],
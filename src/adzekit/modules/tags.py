@@ -6,49 +6,100 @@ source of truth.
 """
 
 import json
+import os
 import re
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from adzekit.config import Settings, get_settings
 
+try:
+    import orjson
+except ImportError:  # optional accelerator -- fall back to the stdlib encoder
+    orjson = None
+
 _TAG_RE = re.compile(r"(?<!\w)#([a-zA-Z][a-zA-Z0-9-]*)")
+_NO_TAGS: frozenset[str] = frozenset()
+
+# Tags per file, with the (mtime_ns, size, inode) they were read at. Only
+# files whose stat changed are re-read when the index is rebuilt.
+_INDEX_CACHE: dict[Path, tuple[tuple[int, int, int], frozenset[str]]] = {}
+
+# Below this many changed files, reading serially beats starting a pool.
+_PARALLEL_MIN = 8
 
 
-def extract_tags(text: str) -> set[str]:
+def extract_tags(text: str) -> frozenset[str]:
     """Extract all #tags from a string.
 
     Returns lowercased tag names without the leading ``#``.
     """
-    return {m.group(1).lower() for m in _TAG_RE.finditer(text)}
+    if "#" not in text:
+        return _NO_TAGS
+    return frozenset(t.lower() for t in _TAG_RE.findall(text))
+
+
+def _iter_md(root: str, skip: set[str]) -> Iterator[os.DirEntry]:
+    """Yield ``.md`` file entries under ``root``, not descending into ``skip``."""
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except FileNotFoundError:
+        return
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            if entry.path not in skip:
+                yield from _iter_md(entry.path, skip)
+        elif entry.name.endswith(".md"):
+            yield entry
+
+
+def _read_tags(md: Path) -> frozenset[str]:
+    return extract_tags(md.read_text(encoding="utf-8"))
 
 
 def tag_index(settings: Settings | None = None) -> dict[str, list[Path]]:
     """Build a mapping from tag -> list of files that contain it.
 
     Scans every ``.md`` file in the shed (excluding ``stock/`` and ``drafts/``).
+    Files unchanged since the last scan reuse their cached tags; when more
+    than a handful changed, they are re-read on a thread pool.
     """
     settings = settings or get_settings()
+    # Skip stock/ and drafts/ -- not part of the backbone
+    skip = {str(settings.stock_dir), str(settings.drafts_dir)}
+    found = sorted(
+        ((Path(e.path), e) for e in _iter_md(str(settings.shed), skip)),
+        key=lambda item: item[0],
+    )
+
+    file_tags: dict[Path, frozenset[str]] = {}
+    todo: list[tuple[Path, tuple[int, int, int]]] = []
+    for md, entry in found:
+        st = entry.stat()
+        stamp = (st.st_mtime_ns, st.st_size, st.st_ino)
+        hit = _INDEX_CACHE.get(md)
+        if hit is not None and hit[0] == stamp:
+            file_tags[md] = hit[1]
+        else:
+            todo.append((md, stamp))
+
+    paths = [md for md, _ in todo]
+    if len(todo) > _PARALLEL_MIN:
+        workers = min(32, (os.cpu_count() or 1) * 4, len(todo))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            read = list(pool.map(_read_tags, paths))
+    else:
+        read = [_read_tags(md) for md in paths]
+    for (md, stamp), tags in zip(todo, read):
+        _INDEX_CACHE[md] = (stamp, tags)
+        file_tags[md] = tags
+
     index: dict[str, list[Path]] = {}
-    stock = settings.stock_dir
-    drafts = settings.drafts_dir
-
-    for md in sorted(settings.shed.rglob("*.md")):
-        # Skip stock/ and drafts/ -- not part of the backbone
-        try:
-            md.relative_to(stock)
-            continue
-        except ValueError:
-            pass
-        try:
-            md.relative_to(drafts)
-            continue
-        except ValueError:
-            pass
-
-        text = md.read_text(encoding="utf-8")
-        for tag in extract_tags(text):
+    for md, _ in found:
+        for tag in file_tags[md]:
             index.setdefault(tag, []).append(md)
-
     return index
 
 
@@ -61,7 +112,7 @@ def files_for_tag(
     return idx.get(tag, [])
 
 
-def tags_for_file(path: Path) -> set[str]:
+def tags_for_file(path: Path) -> frozenset[str]:
     """Return all tags found in a single file."""
     text = path.read_text(encoding="utf-8")
     return extract_tags(text)
@@ -76,6 +127,7 @@ def generate_cursor_snippets(settings: Settings | None = None) -> Path:
     """Generate a .vscode/adzekit.code-snippets file for tag autocomplete.
 
     Each tag in the shed becomes a snippet triggered by typing ``#``.
+    The file is left untouched when its contents would not change.
     Returns the path to the generated file.
     """
     settings = settings or get_settings()
@@ -93,7 +145,16 @@ def generate_cursor_snippets(settings: Settings | None = None) -> Path:
     vscode_dir = settings.shed / ".vscode"
     vscode_dir.mkdir(exist_ok=True)
     snippets_path = vscode_dir / "adzekit.code-snippets"
-    snippets_path.write_text(
-        json.dumps(snippets, indent=2) + "\n", encoding="utf-8"
-    )
+    if orjson is not None:
+        data = orjson.dumps(
+            snippets, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+        )
+    else:
+        data = (json.dumps(snippets, indent=2) + "\n").encode("utf-8")
+    try:
+        if snippets_path.read_bytes() == data:
+            return snippets_path
+    except FileNotFoundError:
+        pass
+    snippets_path.write_bytes(data)
     return snippets_path
@@ -13,6 +13,9 @@ active status:
 The LLM can draft answers; the human decides.
 """
 
+import errno
+import os
+import shutil
 from pathlib import Path
 
 from adzekit.config import Settings, get_settings
@@ -27,6 +30,16 @@ WIP_QUESTIONS = [
 ]
 
 
+def _move(src: Path, dst: Path) -> None:
+    """Rename src to dst, copying only when they are on different filesystems."""
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(str(src), str(dst))
+
+
 def count_active_projects(settings: Settings | None = None) -> int:
     """Return the number of currently active projects."""
     settings = settings or get_settings()
@@ -74,7 +87,7 @@ def activate_project(project_slug: str, settings: Settings | None = None) -> Pat
     if not src.exists():
         raise FileNotFoundError(f"Project '{project_slug}' not found in backlog/.")
     dst = settings.active_dir / f"{project_slug}.md"
-    src.rename(dst)
+    _move(src, dst)
     return dst
 
 
@@ -88,7 +101,7 @@ def archive_project(project_slug: str, settings: Settings | None = None) -> Path
     if not src.exists():
         raise FileNotFoundError(f"Project '{project_slug}' not found in active/.")
     dst = settings.archive_dir / f"{project_slug}.md"
-    src.rename(dst)
+    _move(src, dst)
     return dst
 
 
@@ -103,7 +116,7 @@ def demote_project(project_slug: str, settings: Settings | None = None) -> Path:
         raise FileNotFoundError(f"Project '{project_slug}' not found in active/.")
     settings.backlog_dir.mkdir(parents=True, exist_ok=True)
     dst = settings.backlog_dir / f"{project_slug}.md"
-    src.rename(dst)
+    _move(src, dst)
     return dst
 
 
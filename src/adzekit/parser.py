@@ -3,9 +3,14 @@
 Reads structured markdown formats and returns typed model objects.
 """
 
+import os
+import pickle
 import re
+import threading
+from collections import OrderedDict
 from datetime import date
 from pathlib import Path
+from typing import Callable, TypeVar
 
 from adzekit.models import (
     DailyNote,
@@ -16,6 +21,46 @@ from adzekit.models import (
     Task,
 )
 
+_T = TypeVar("_T")
+
+# Pickled parse results by (path, key), with the (mtime_ns, size) they came
+# from. Least recently used entries are dropped past _PARSE_CACHE_MAX, so
+# renamed or deleted files do not accumulate in long-running processes.
+_PARSE_CACHE_MAX = 512
+_PARSE_CACHE: OrderedDict[tuple, tuple[int, int, bytes]] = OrderedDict()
+_parse_cache_lock = threading.Lock()
+
+
+def _load_or_parse(path: Path, parse: Callable[[Path], _T], key: tuple = ()) -> _T:
+    """Return ``parse(path)``, reusing the previous result while the file is unchanged.
+
+    Results are kept pickled, so every hit unpickles a fresh object that
+    the caller may mutate. ``key`` distinguishes parses of the same file
+    with different arguments.
+    """
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cache_key = (path, *key)
+    with _parse_cache_lock:
+        hit = _PARSE_CACHE.get(cache_key)
+        if hit is not None and hit[:2] == stamp:
+            _PARSE_CACHE.move_to_end(cache_key)
+            data = hit[2]
+        else:
+            data = None
+    if data is not None:
+        return pickle.loads(data)
+
+    result = parse(path)
+    data = pickle.dumps(result, pickle.HIGHEST_PROTOCOL)
+    with _parse_cache_lock:
+        _PARSE_CACHE[cache_key] = (*stamp, data)
+        _PARSE_CACHE.move_to_end(cache_key)
+        while len(_PARSE_CACHE) > _PARSE_CACHE_MAX:
+            _PARSE_CACHE.popitem(last=False)
+    return result
+
+
 # --- Loop parsing ---
 
 # Flat checklist format: - [ ] (SIZE) [DATE] title (DUE-DATE)
@@ -175,8 +220,15 @@ def parse_project(project_path: Path, state: ProjectState) -> Project:
     """Parse a single project markdown file into a Project object.
 
     Tasks are extracted from the ``## Log`` section where checklist items
-    and dated events are interleaved.
+    and dated events are interleaved. Unchanged files reuse the previous
+    parse.
     """
+    return _load_or_parse(
+        project_path, lambda p: _parse_project_file(p, state), key=("project", state)
+    )
+
+
+def _parse_project_file(project_path: Path, state: ProjectState) -> Project:
     slug = project_path.stem
     text = project_path.read_text(encoding="utf-8")
     title = slug
@@ -119,7 +119,7 @@ async def api_projects():
             "state": p.state.value,
             "progress": round(p.progress, 2),
             "total_tasks": len(p.tasks),
-            "done_tasks": sum(1 for t in p.tasks if t.done),
+            "done_tasks": p.done_count,
         }
         for p in projects
     ]
@@ -151,16 +151,25 @@ Write one concept per file. Link to related notes with standard [markdown links]
     )
 
 
+def daily_note_path(
+    target_date: date | None = None,
+    settings: Settings | None = None,
+) -> Path:
+    """Path of the daily note for target_date, without touching the filesystem."""
+    settings = settings or get_settings()
+    target_date = target_date or date.today()
+    return settings.daily_dir / f"{target_date.isoformat()}.md"
+
+
 def create_daily_note(
     target_date: date | None = None,
     settings: Settings | None = None,
 ) -> Path:
     """Create a daily note from the template if one doesn't exist."""
-    settings = settings or get_settings()
     target_date = target_date or date.today()
     weekday = target_date.strftime("%A")
     iso = target_date.isoformat()
-    path = settings.daily_dir / f"{iso}.md"
+    path = daily_note_path(target_date, settings)
 
     if path.exists():
         return path
@@ -2,7 +2,15 @@
 
 import pytest
 
-from adzekit.config import Settings
+from adzekit.config import Settings, reset_settings_cache
+
+
+@pytest.fixture(autouse=True)
+def _fresh_settings_cache():
+    """Start every test without memoized Settings or parsed config files."""
+    reset_settings_cache()
+    yield
+    reset_settings_cache()
 
 
 @pytest.fixture
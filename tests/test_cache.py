@@ -0,0 +1,126 @@
+"""Tests for the agent tool result cache."""
+
+import json
+
+import pytest
+
+from adzekit.agent import cache
+from adzekit.agent.tools import ToolRegistry
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache():
+    cache.invalidate()
+    yield
+    cache.invalidate()
+
+
+def test_cached_tool_reuses_result():
+    calls = []
+
+    @cache.cached_tool()
+    def read(x: int = 0) -> str:
+        calls.append(x)
+        return str(x)
+
+    assert read(x=1) == "1"
+    assert read(x=1) == "1"
+    assert read(x=2) == "2"
+    assert calls == [1, 2]
+
+
+def test_cached_tool_expires(monkeypatch):
+    calls = []
+    clock = [100.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: clock[0])
+
+    @cache.cached_tool(ttl=5)
+    def read() -> str:
+        calls.append(1)
+        return "ok"
+
+    read()
+    clock[0] += 10
+    read()
+    assert len(calls) == 2
+
+
+def test_invalidate_by_name():
+    calls = []
+
+    @cache.cached_tool()
+    def read() -> str:
+        calls.append(1)
+        return "ok"
+
+    read()
+    cache.invalidate("read")
+    read()
+    assert len(calls) == 2
+
+
+def test_cached_tool_keeps_signature_for_registry():
+    reg = ToolRegistry()
+
+    @reg.register
+    @cache.cached_tool()
+    def lookup(query: str, limit: int = 5) -> str:
+        """Look something up."""
+        return query
+
+    tool = reg.get("lookup")
+    assert tool.description == "Look something up."
+    assert [(p.name, p.type, p.required) for p in tool.parameters] == [
+        ("query", "string", True),
+        ("limit", "integer", False),
+    ]
+
+
+def test_propose_busts_drafts_listing(workspace, monkeypatch):
+    monkeypatch.setenv("ADZEKIT_SHED", str(workspace.shed))
+    from adzekit.agent import shed_tools
+
+    before = json.loads(shed_tools.shed_list_drafts())
+    shed_tools.shed_save_summary("triage.md", "# Triage\n")
+    after = json.loads(shed_tools.shed_list_drafts())
+
+    assert after["count"] == before["count"] + 1
+    assert "triage.md" in after["files"]
+
+
+def test_list_drafts_limit(workspace, monkeypatch):
+    monkeypatch.setenv("ADZEKIT_SHED", str(workspace.shed))
+    from adzekit.agent import shed_tools
+
+    for name in ("a-2026-01-01.md", "b-2026-01-02.md", "c-2026-01-03.md"):
+        (workspace.drafts_dir / name).write_text("x", encoding="utf-8")
+
+    result = json.loads(shed_tools.shed_list_drafts(limit=2))
+    assert result["files"] == ["b-2026-01-02.md", "c-2026-01-03.md"]
+
+
+def test_cached_tool_is_keyed_on_shed(tmp_path, monkeypatch):
+    calls = []
+
+    @cache.cached_tool()
+    def read() -> str:
+        calls.append(1)
+        return "ok"
+
+    monkeypatch.setenv("ADZEKIT_SHED", str(tmp_path / "one"))
+    read()
+    read()
+    monkeypatch.setenv("ADZEKIT_SHED", str(tmp_path / "two"))
+    read()
+    assert len(calls) == 2
+
+
+def test_active_loops_tool_sees_external_edits(workspace, monkeypatch):
+    monkeypatch.setenv("ADZEKIT_SHED", str(workspace.shed))
+    from adzekit.agent import shed_tools
+
+    assert json.loads(shed_tools.shed_get_active_loops())["count"] == 0
+    workspace.loops_active.write_text(
+        "# Active Loops\n\n- [ ] [2026-01-01] Call back\n", encoding="utf-8"
+    )
+    assert json.loads(shed_tools.shed_get_active_loops())["count"] == 1
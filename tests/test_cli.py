@@ -1,5 +1,6 @@
 """Tests for the AdzeKit CLI."""
 
+import argparse
 from datetime import date
 
 from adzekit.cli import main
@@ -136,3 +137,307 @@ def test_setup_sync_writes_config(tmp_path, monkeypatch, capsys):
     assert config.exists()
     content = config.read_text()
     assert "rclone_remote = gdrive:mykit" in content
+
+
+def test_adze_output_is_captured(capsys):
+    main(["adze"])
+    assert "A D Z E K I T" in capsys.readouterr().out
+
+
+def test_adze_fast_path_skips_config_import():
+    import subprocess
+    import sys
+
+    code = (
+        "import sys; from adzekit.cli import main; main(['adze']); "
+        "assert 'adzekit.config' not in sys.modules"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+    )
+    assert "A D Z E K I T" in out.stdout
+
+
+def test_agent_without_api_key_fails_before_tool_import(tmp_path, monkeypatch, capsys):
+    import pytest
+
+    from adzekit.agent import client
+
+    monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+    no_key = client.LLMSettings(anthropic_api_key="")
+    monkeypatch.setattr(client, "get_llm_settings", lambda: no_key)
+    with pytest.warns(DeprecationWarning), pytest.raises(SystemExit):
+        main(["agent", "hello"])
+    assert "ANTHROPIC_API_KEY" in capsys.readouterr().err
+
+
+def test_init_prints_tree(tmp_path, capsys):
+    target = tmp_path / "shed"
+    main(["init", str(target)])
+    (target / ".hidden").mkdir()
+    (target / "notes.txt").write_text("skip me")
+    capsys.readouterr()
+
+    from adzekit.cli import _print_tree
+
+    _print_tree(target, target)
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0] == "├── daily/"
+    assert "│   ├── active.md" in lines
+    assert lines[-1] == "└── bench.md"
+    assert not any(".hidden" in line or "notes.txt" in line for line in lines)
+
+
+def test_log_sweep_inserts_under_log_heading(tmp_path):
+    from adzekit.cli import _log_sweep_to_daily
+    from adzekit.config import Settings
+    from adzekit.workspace import create_daily_note, init_shed
+
+    settings = Settings(shed=tmp_path)
+    init_shed(settings)
+    path = create_daily_note(settings=settings)
+    path.write_text("# Today\n\n## Log\n\n- earlier\n\n## Notes\n", encoding="utf-8")
+
+    _log_sweep_to_daily(2, settings)
+    assert path.read_text(encoding="utf-8") == (
+        "# Today\n\n## Log\n\n- Swept 2 loop(s) closed\n- earlier\n\n## Notes\n"
+    )
+
+    path.write_text("# Today\n\nno log here\n\n", encoding="utf-8")
+    _log_sweep_to_daily(1, settings)
+    assert path.read_text(encoding="utf-8") == (
+        "# Today\n\nno log here\n\n- Swept 1 loop(s) closed\n"
+    )
+
+
+def test_log_sweep_creates_missing_daily_note(tmp_path):
+    from adzekit.cli import _log_sweep_to_daily
+    from adzekit.config import Settings
+    from adzekit.workspace import daily_note_path, init_shed
+
+    settings = Settings(shed=tmp_path)
+    init_shed(settings)
+    path = daily_note_path(settings=settings)
+    path.unlink(missing_ok=True)
+
+    _log_sweep_to_daily(3, settings)
+    assert "## Log\n\n- Swept 3 loop(s) closed\n" in path.read_text(encoding="utf-8")
+
+
+def test_build_parser_is_cached():
+    from adzekit.cli import build_parser
+
+    assert build_parser() is build_parser()
+    args = build_parser().parse_args(["sync", "pull"])
+    assert args.direction == "pull"
+    assert build_parser().parse_args(["sync"]).direction is None
+
+
+def test_build_parser_registers_only_the_named_command():
+    from adzekit.cli import _command_in, build_parser
+
+    assert _command_in(["--shed", "status", "sync", "pull"]) == "sync"
+    assert _command_in(["--help"]) is None
+    assert _command_in(["bogus"]) is None
+
+    parser = build_parser("sync")
+    assert parser is build_parser("sync")
+    sub = next(a for a in parser._actions if isinstance(a, argparse._SubParsersAction))
+    assert list(sub.choices) == ["sync"]
+    assert parser.parse_args(["--shed", "x", "sync", "push"]).direction == "push"
+
+
+def test_bare_commands_skip_argparse(tmp_path):
+    from pathlib import Path
+
+    from adzekit.cli import _bare_args, build_parser, cmd_status
+
+    args = _bare_args(["--shed", "~/shed", "status"])
+    assert args.func is cmd_status
+    assert args.shed == Path("~/shed").expanduser()
+    assert _bare_args(["--shed=x", "today"]).shed == Path("x")
+    assert _bare_args(["status", "--help"]) is None
+    assert _bare_args(["sync"]) is None
+
+    expected = build_parser().parse_args(["--shed", str(tmp_path), "sweep"])
+    assert _bare_args(["--shed", str(tmp_path), "sweep"]) == expected
+
+
+def test_sweep_and_tags_output(tmp_path, capsys):
+    target = tmp_path / "shed"
+    main(["init", str(target)])
+    (target / "loops" / "active.md").write_text(
+        "# Active Loops\n\n- [x] (S) [2026-01-01] Send deck\n- [ ] (M) [2026-01-02] Call Ann\n",
+        encoding="utf-8",
+    )
+    (target / "knowledge" / "tagged.md").write_text("#alpha and #beta\n", encoding="utf-8")
+    capsys.readouterr()
+
+    main(["--shed", str(target), "sweep"])
+    assert capsys.readouterr().out == "  swept: Send deck\n\n1 loop(s) moved to archive.md\n"
+
+    main(["--shed", str(target), "tags", "alpha"])
+    assert capsys.readouterr().out == "#alpha (1 files):\n  knowledge/tagged.md\n"
+
+    main(["--shed", str(target), "tags"])
+    out = capsys.readouterr().out
+    assert "  #alpha\n  #beta\n" in out
+    assert out.endswith(" tags\n")
+
+
+def test_adze_writes_banner_to_fd(capfd):
+    from adzekit.cli import ADZE
+
+    main(["adze"])
+    assert capfd.readouterr().out == ADZE + "\n"
+
+
+def test_invalid_date_rejected_by_parser(tmp_path, capsys):
+    import pytest
+
+    target = tmp_path / "shed"
+    main(["init", str(target)])
+    with pytest.raises(SystemExit) as exc:
+        main(["--shed", str(target), "add-loop", "Ping Ann", "--due", "next week"])
+    assert exc.value.code == 2
+    assert "expected YYYY-MM-DD" in capsys.readouterr().err
+
+
+def test_sync_runs_selected_steps(tmp_path, monkeypatch, capsys):
+    from adzekit.config import Settings
+
+    target = tmp_path / "shed"
+    main(["init", str(target)])
+    calls = []
+    monkeypatch.setattr(Settings, "sync_workbench", lambda self: calls.append("pull"))
+    monkeypatch.setattr(Settings, "push_workbench", lambda self: calls.append("push"))
+    capsys.readouterr()
+
+    main(["--shed", str(target), "sync", "push"])
+    assert calls == ["push"]
+    assert capsys.readouterr().out.endswith("Push complete. Tag snippets refreshed.\n")
+
+    main(["--shed", str(target), "sync"])
+    assert calls == ["push", "pull", "push"]
+    assert "Sync complete (pull + push)." in capsys.readouterr().out
+
+
+def test_settings_memoized_per_shed(tmp_path, monkeypatch):
+    from pathlib import Path
+
+    from adzekit.config import _cached_settings, get_settings, settings_for
+
+    target = tmp_path / "shed"
+    main(["init", str(target)])
+    first = settings_for(target)
+    built = _cached_settings.cache_info().misses
+    again = settings_for(target)
+    assert _cached_settings.cache_info().misses == built
+    # Callers get separate copies of the memoized instance.
+    assert again is not first and again.shed == first.shed
+    again.__dict__["loops_dir"] = tmp_path / "elsewhere"
+    assert settings_for(target).loops_dir == target / "loops"
+    # ~ and relative spellings share the normalised entry.
+    monkeypatch.setenv("HOME", str(tmp_path))
+    settings_for(Path("~/shed"))
+    assert _cached_settings.cache_info().misses == built
+
+    monkeypatch.setenv("ADZEKIT_SHED", str(target))
+    get_settings()
+    monkeypatch.delenv("ADZEKIT_SHED")
+
+    first.set_config("rclone_remote", "gdrive:elsewhere")
+    changed = settings_for(target)
+    assert changed is not first
+    assert changed.rclone_remote == "gdrive:elsewhere"
+
+    monkeypatch.setenv("ADZEKIT_RCLONE_REMOTE", "gdrive:env")
+    assert settings_for(target).rclone_remote == "gdrive:env"
+
+
+def test_settings_memo_sees_same_size_rewrite(tmp_path):
+    import os
+
+    from adzekit.config import settings_for
+
+    target = tmp_path / "shed"
+    main(["init", str(target)])
+    settings_for(target).set_config("rclone_remote", "gdrive:aaaa")
+    marker = target / ".adzekit"
+    st = marker.stat()
+    assert settings_for(target).rclone_remote == "gdrive:aaaa"
+
+    settings_for(target).set_config("rclone_remote", "gdrive:bbbb")
+    os.utime(marker, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert marker.stat().st_size == st.st_size
+    assert settings_for(target).rclone_remote == "gdrive:bbbb"
+
+
+def test_agent_registers_shed_tools(monkeypatch, capsys):
+    import pytest
+
+    from adzekit.agent import client, orchestrator
+    from adzekit.agent.orchestrator import AgentResult
+    from adzekit.agent.tools import registry
+
+    monkeypatch.setattr(client, "create_client", lambda: None)
+    monkeypatch.setattr(
+        orchestrator, "run_agent",
+        lambda message: AgentResult(response=f"echo: {message}", turns=[], tool_calls_made=0),
+    )
+    with pytest.warns(DeprecationWarning):
+        main(["agent", "hello"])
+
+    assert "shed_get_active_loops" in {t.name for t in registry.list_tools()}
+    assert "echo: hello" in capsys.readouterr().out
+
+
+def test_help_and_version_skip_config_import():
+    import subprocess
+    import sys
+
+    for flag, expected in (("--help", "usage: adzekit"), ("--version", "adzekit ")):
+        code = (
+            "import sys\nfrom adzekit.cli import main\n"
+            f"try:\n    main([{flag!r}])\nexcept SystemExit:\n    pass\n"
+            "assert 'adzekit.config' not in sys.modules"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+        )
+        assert expected in out.stdout
+
+
+def test_setup_sync_matches_one_of_many_remotes(tmp_path, monkeypatch, capsys):
+    import pytest
+
+    target = tmp_path / "shed"
+    main(["init", str(target)])
+    fake_bin = tmp_path / "bin"
+    fake_bin.mkdir()
+    fake_rclone = fake_bin / "rclone"
+    fake_rclone.write_text(
+        "#!/bin/sh\nprintf 's3:\\nmy drive:\\nbox:\\n'\n", encoding="utf-8",
+    )
+    fake_rclone.chmod(0o755)
+    monkeypatch.setenv("PATH", str(fake_bin))
+
+    main(["--shed", str(target), "setup-sync", "--remote", "my drive"])
+    assert "rclone_remote = my drive:adzekit" in (target / ".adzekit").read_text()
+
+    with pytest.raises(SystemExit):
+        main(["--shed", str(target), "setup-sync", "--remote", "my"])
+
+
+def test_config_builds_settings_lazily():
+    import subprocess
+    import sys
+
+    code = (
+        "import sys\nimport adzekit.config as config\n"
+        "assert 'pydantic_settings' not in sys.modules\n"
+        "assert config.Settings is config.Settings\n"
+        "assert config.Settings.__qualname__ == 'Settings'\n"
+        "assert 'pydantic_settings' in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
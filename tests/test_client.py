@@ -0,0 +1,44 @@
+"""Tests for the LLM client cache."""
+
+import pytest
+
+from adzekit.agent.client import LLMSettings, _client_cache, close_clients, create_client
+
+pytest.importorskip("anthropic")
+
+
+@pytest.fixture(autouse=True)
+def _clean_cache():
+    close_clients()
+    yield
+    close_clients()
+
+
+def test_create_client_is_cached():
+    settings = LLMSettings(anthropic_api_key="test-key")
+    assert create_client(settings) is create_client(settings)
+    assert len(_client_cache) == 1
+
+
+def test_create_client_keyed_by_api_key():
+    a = create_client(LLMSettings(anthropic_api_key="key-a"))
+    b = create_client(LLMSettings(anthropic_api_key="key-b"))
+    assert a is not b
+
+
+def test_create_client_requires_key(monkeypatch):
+    monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+    with pytest.raises(ValueError):
+        create_client(LLMSettings(anthropic_api_key="", _env_file=None))
+
+
+def test_close_clients_empties_cache():
+    create_client(LLMSettings(anthropic_api_key="test-key"))
+    close_clients()
+    assert _client_cache == {}
+
+
+def test_create_client_uses_tuned_pool():
+    client = create_client(LLMSettings(anthropic_api_key="test-key"))
+    assert client.timeout.connect == 10.0
+    assert client.timeout.read == 60.0
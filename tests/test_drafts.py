@@ -95,3 +95,19 @@ def test_cli_prune_drafts(tmp_path, capsys):
     main(["--shed", str(tmp_path / "shed"), "prune-drafts"])
     output = capsys.readouterr().out
     assert "No stale drafts" in output
+
+
+def test_cli_prune_drafts_lists_deleted(tmp_path, capsys):
+    shed = tmp_path / "shed"
+    main(["init", str(shed)])
+    for name in ("a.md", "b.md"):
+        draft = shed / "drafts" / name
+        draft.write_text("# Old\n")
+        _age_file(draft, 10)
+    capsys.readouterr()
+
+    main(["--shed", str(shed), "prune-drafts", "--days", "7"])
+    output = capsys.readouterr().out
+    assert "  deleted: a.md\n" in output
+    assert "  deleted: b.md\n" in output
+    assert output.endswith("\n2 draft(s) pruned.\n")
@@ -50,3 +50,51 @@ def test_to_docx_with_tables(tmp_path):
     result = to_docx(md)
     assert result.exists()
     assert result.stat().st_size > 0
+
+
+def test_reference_doc_rebuilt_only_when_key_changes(tmp_path, monkeypatch):
+    from adzekit.modules import export
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    cache = tmp_path / "adzekit"
+    export._cached_reference_doc.cache_clear()
+    ref = export._get_reference_doc()
+    assert (cache / "reference.docx.key").read_text() == export._reference_key()
+    built = ref.stat().st_mtime_ns
+
+    export._cached_reference_doc.cache_clear()
+    assert export._get_reference_doc().stat().st_mtime_ns == built
+
+    (cache / "reference.docx.key").write_text("stale")
+    export._cached_reference_doc.cache_clear()
+    export._get_reference_doc()
+    assert (cache / "reference.docx.key").read_text() == export._reference_key()
+    export._cached_reference_doc.cache_clear()
+
+
+def test_needs_postprocess_only_for_tables_or_sections(tmp_path):
+    from docx import Document
+
+    from adzekit.modules.export import _needs_postprocess
+
+    doc = Document()
+    doc.add_paragraph("plain")
+    doc.save(str(tmp_path / "plain.docx"))
+    assert not _needs_postprocess(tmp_path / "plain.docx")
+
+    doc.add_table(rows=1, cols=1)
+    doc.save(str(tmp_path / "table.docx"))
+    assert _needs_postprocess(tmp_path / "table.docx")
+
+    doc = Document()
+    doc.add_section()
+    doc.save(str(tmp_path / "sections.docx"))
+    assert _needs_postprocess(tmp_path / "sections.docx")
+
+
+def test_import_does_not_load_docx():
+    import subprocess
+    import sys
+
+    code = "import sys\nimport adzekit.modules.export\nassert 'docx' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True)
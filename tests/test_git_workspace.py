@@ -94,12 +94,16 @@ def test_commit_shed(git_settings):
     _git(git_settings.shed, "config", "user.email", "test@test.com")
     _git(git_settings.shed, "config", "user.name", "Test")
 
+    assert not git_settings.is_dirty()
     assert git_settings.commit_shed("nothing") is False
 
+    (git_settings.shed / "notes.md").write_text("untracked\n", encoding="utf-8")
+    assert git_settings.is_dirty()
     (git_settings.shed / "bench.md").write_text(
         "# Bench\n\n- [2026-02-16] test entry\n", encoding="utf-8"
     )
     assert git_settings.commit_shed("add entry") is True
+    assert not git_settings.is_dirty()
 
     verify = git_settings.shed.parent / "verify"
     _git(
@@ -109,6 +113,19 @@ def test_commit_shed(git_settings):
     assert "test entry" in (verify / "bench.md").read_text()
 
 
+def test_commit_shed_raises_when_commit_fails(git_settings):
+    git_settings.sync_shed()
+    _git(git_settings.shed, "config", "user.email", "test@test.com")
+    _git(git_settings.shed, "config", "user.name", "Test")
+    hook = git_settings.shed / ".git" / "hooks" / "pre-commit"
+    hook.write_text("#!/bin/sh\nexit 1\n", encoding="utf-8")
+    hook.chmod(0o755)
+
+    (git_settings.shed / "bench.md").write_text("# Bench\n\nchanged\n", encoding="utf-8")
+    with pytest.raises(subprocess.CalledProcessError):
+        git_settings.commit_shed("blocked")
+
+
 def test_shed_git_status(git_settings):
     git_settings.sync_shed()
     assert git_settings.shed_git_status() == ""
@@ -128,3 +145,66 @@ def test_commit_without_git_repo_raises():
     s = Settings()
     with pytest.raises(ValueError, match="git_repo is not configured"):
         s.commit_shed()
+
+
+def test_project_ages_matches_file_age(tmp_path, monkeypatch):
+    from datetime import date
+
+    from adzekit.modules.git_age import file_age, project_ages
+
+    settings = Settings(shed=tmp_path / "shed")
+    settings.ensure_shed()
+    shed = settings.shed
+    _git(shed, "init", "-b", "main")
+    _git(shed, "config", "user.email", "test@test.com")
+    _git(shed, "config", "user.name", "Test")
+
+    def commit(day, message):
+        monkeypatch.setenv("GIT_AUTHOR_DATE", f"{day}T12:00:00+00:00")
+        _git(shed, "add", "-A")
+        _git(shed, "commit", "-m", message)
+
+    (settings.active_dir / "alpha.md").write_text("# Alpha\n", encoding="utf-8")
+    commit("2026-01-05", "add alpha")
+    (settings.active_dir / "alpha.md").write_text("# Alpha\n\nmore\n", encoding="utf-8")
+    (settings.backlog_dir / "beta.md").write_text("# Beta\n", encoding="utf-8")
+    commit("2026-02-10", "edit alpha, add beta")
+    (settings.backlog_dir / "gamma.md").write_text("# Gamma\n", encoding="utf-8")
+
+    ages = {a.path.name: a for a in project_ages(settings)}
+    assert ages["alpha.md"].created == date(2026, 1, 5)
+    assert ages["alpha.md"].modified == date(2026, 2, 10)
+    assert ages["gamma.md"].created is None
+    for age in ages.values():
+        assert age == file_age(age.path, settings)
+        assert age.as_of == date.today()
+    assert ages["alpha.md"].stale_days == (date.today() - date(2026, 2, 10)).days
+
+
+def test_project_ages_follows_moves(tmp_path, monkeypatch):
+    from datetime import date
+
+    from adzekit.modules.git_age import file_age, project_ages
+
+    settings = Settings(shed=tmp_path / "shed")
+    settings.ensure_shed()
+    shed = settings.shed
+    _git(shed, "init", "-b", "main")
+    _git(shed, "config", "user.email", "test@test.com")
+    _git(shed, "config", "user.name", "Test")
+
+    def commit(day, message):
+        monkeypatch.setenv("GIT_AUTHOR_DATE", f"{day}T12:00:00+00:00")
+        _git(shed, "add", "-A")
+        _git(shed, "commit", "-m", message)
+
+    (settings.backlog_dir / "foo.md").write_text("# Foo\n\nSome body text.\n", encoding="utf-8")
+    commit("2025-01-01", "add foo to backlog")
+    _git(shed, "mv", str(settings.backlog_dir / "foo.md"), str(settings.active_dir / "foo.md"))
+    commit("2026-06-01", "promote foo")
+
+    (age,) = [a for a in project_ages(settings) if a.path.name == "foo.md"]
+    assert age.path == settings.active_dir / "foo.md"
+    assert age.created == date(2025, 1, 1)
+    assert age.modified == date(2026, 6, 1)
+    assert age == file_age(age.path, settings)
@@ -15,7 +15,7 @@ def _client_with_settings(settings):
     # The app uses adzekit.config.get_settings via _settings(); monkeypatch by
     # reassigning the cached function output.
     import adzekit.config as cfg
-    cfg.get_settings.cache_clear() if hasattr(cfg.get_settings, "cache_clear") else None
+    cfg.reset_settings_cache()
     cfg._settings_override = settings  # not really used; rely on env
 
     return TestClient(ui_app.app)
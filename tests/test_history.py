@@ -0,0 +1,37 @@
+"""Tests for agent conversation-history pruning."""
+
+import json
+
+from adzekit.agent.history import ConversationHistory
+
+
+def _exchange(history, id_, content):
+    tool_use = {"id": id_, "name": "big", "input": {}}
+    result = {"type": "tool_result", "tool_use_id": id_, "content": content}
+    history.add_turn([], [tool_use], [result])
+    return result
+
+
+def test_small_history_untouched():
+    history = ConversationHistory([], max_chars=1000, keep_turns=1)
+    _exchange(history, "t1", "x" * 100)
+    _exchange(history, "t2", "y" * 100)
+    assert not history.pruned
+    assert history.messages[1]["content"][0]["content"] == "x" * 100
+
+
+def test_old_results_pruned_recent_kept():
+    history = ConversationHistory([], max_chars=1000, keep_turns=1)
+    first = _exchange(history, "t1", "x" * 800)
+    _exchange(history, "t2", "y" * 800)
+
+    assert history.pruned
+    synopsis = json.loads(history.messages[1]["content"][0]["content"])
+    assert synopsis["tool"] == "big"
+    assert synopsis["tool_use_id"] == "t1"
+    assert synopsis["bytes"] == 800
+    assert history.messages[3]["content"][0]["content"] == "y" * 800
+    # The caller's trace keeps the full output, and it can be recalled.
+    assert first["content"] == "x" * 800
+    assert history.recall("t1") == "x" * 800
+    assert "error" in history.recall("missing")
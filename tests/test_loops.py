@@ -14,6 +14,7 @@ from adzekit.modules.loops import (
     get_overdue_loops,
     loop_stats,
 )
+from adzekit.parser import parse_loops
 
 
 def _make_loop(title="Test loop", who="Alice", days_ago=0, due_in=3):
@@ -53,6 +54,18 @@ def test_close_loop(workspace):
     assert len(closed_files) == 1
 
 
+def test_close_loops_append_to_weekly_archive(workspace):
+    add_loop(_make_loop(title="First"), workspace)
+    add_loop(_make_loop(title="Second"), workspace)
+    close_loop("First", workspace)
+    close_loop("Second", workspace)
+
+    (archive,) = workspace.loops_archive_dir.glob("*.md")
+    text = archive.read_text(encoding="utf-8")
+    assert text.startswith("# Archived Loops -- ")
+    assert [loop.title for loop in parse_loops(text)] == ["First", "Second"]
+
+
 def test_close_nonexistent_loop(workspace):
     result = close_loop("Does not exist", workspace)
     assert result is False
@@ -77,3 +90,27 @@ def test_loop_stats(workspace):
     stats = loop_stats(workspace)
     assert stats["active"] == 2
     assert "waiting" not in stats
+
+
+def test_loop_stats_reads_active_once(workspace, monkeypatch):
+    add_loop(_make_loop(title="Late", due_in=-1), workspace)
+    from adzekit.modules import loops
+
+    calls = []
+    real = loops.get_active_loops
+    monkeypatch.setattr(
+        loops, "get_active_loops", lambda s=None: calls.append(1) or real(s)
+    )
+    stats = loop_stats(workspace)
+    assert stats["overdue"] == 1
+    assert len(calls) == 1
+
+
+def test_loop_stats_counts_overdue_and_approaching(workspace):
+    add_loop(_make_loop(title="Old and late", days_ago=3, due_in=-1), workspace)
+    add_loop(_make_loop(title="Old", days_ago=3, due_in=2), workspace)
+    add_loop(_make_loop(title="Fresh"), workspace)
+
+    stats = loop_stats(workspace)
+    assert stats["overdue"] == 1
+    assert stats["approaching_sla"] == 2
@@ -0,0 +1,147 @@
+"""Tests for the agent orchestrator loop.
+
+The LLM call is replaced with a scripted sequence of responses; tools are real.
+"""
+
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from adzekit.agent import orchestrator
+from adzekit.agent.client import LLMSettings
+from adzekit.agent.scheduler import LLMScheduler
+from adzekit.agent.tools import ToolRegistry
+
+
+def _tool_use(id_, name, input_=None):
+    return SimpleNamespace(type="tool_use", id=id_, name=name, input=input_ or {})
+
+
+def _text(text):
+    return SimpleNamespace(type="text", text=text)
+
+
+@pytest.fixture
+def scripted_chat(monkeypatch):
+    """Replace chat() with a function that replays the given responses."""
+    def install(*responses):
+        queue = list(responses)
+
+        def fake_chat(**kwargs):
+            return SimpleNamespace(content=queue.pop(0))
+
+        monkeypatch.setattr(orchestrator, "chat", fake_chat)
+
+    return install
+
+
+def test_run_agent_returns_final_text(scripted_chat):
+    scripted_chat([_text("All done.")])
+    result = orchestrator.run_agent(
+        "hi", tool_registry=ToolRegistry(), settings=LLMSettings(),
+    )
+    assert result.response == "All done."
+    assert result.tool_calls_made == 0
+
+
+def test_tool_calls_run_concurrently_in_order(scripted_chat):
+    reg = ToolRegistry()
+    barrier = threading.Barrier(2, timeout=5)
+
+    @reg.register
+    def echo(value: str) -> str:
+        """Echo after every parallel call has started."""
+        barrier.wait()
+        return value
+
+    scripted_chat(
+        [
+            _tool_use("t1", "echo", {"value": "first"}),
+            _tool_use("t2", "echo", {"value": "second"}),
+        ],
+        [_text("done")],
+    )
+    result = orchestrator.run_agent("go", tool_registry=reg, settings=LLMSettings())
+
+    assert result.tool_calls_made == 2
+    tool_results = result.turns[0].tool_results
+    assert [r["tool_use_id"] for r in tool_results] == ["t1", "t2"]
+    assert [r["content"] for r in tool_results] == ["first", "second"]
+
+
+def test_run_agent_async_gathers_tool_calls(monkeypatch):
+    reg = ToolRegistry()
+
+    @reg.register
+    def shout(value: str) -> str:
+        """Upper-case the value."""
+        return value.upper()
+
+    queue = [
+        [_tool_use("a", "shout", {"value": "x"}), _tool_use("b", "shout", {"value": "y"})],
+        [_text("finished")],
+    ]
+
+    async def fake_achat(**kwargs):
+        return SimpleNamespace(content=queue.pop(0))
+
+    monkeypatch.setattr(orchestrator, "achat", fake_achat)
+
+    async def main():
+        return await orchestrator.run_agent_async(
+            "go",
+            tool_registry=reg,
+            settings=LLMSettings(),
+            scheduler=LLMScheduler(max_parallel=1, tokens_per_minute=1_000_000),
+        )
+
+    result = asyncio.run(main())
+    assert result.response == "finished"
+    assert [r["content"] for r in result.turns[0].tool_results] == ["X", "Y"]
+
+
+def test_run_many_returns_results_in_order(monkeypatch):
+    async def fake_achat(messages, **kwargs):
+        await asyncio.sleep(0)
+        return SimpleNamespace(content=[_text(f"re: {messages[-1]['content']}")])
+
+    monkeypatch.setattr(orchestrator, "achat", fake_achat)
+
+    with orchestrator.AgentRunner(
+        tool_registry=ToolRegistry(), settings=LLMSettings(),
+    ) as runner:
+        results = runner.run_many(["one", "two", "three"])
+
+    assert [r.response for r in results] == ["re: one", "re: two", "re: three"]
+
+
+def test_pruned_history_offers_recall_tool(scripted_chat, monkeypatch):
+    reg = ToolRegistry()
+
+    @reg.register
+    def big() -> str:
+        """Return a lot of text."""
+        return "z" * 500
+
+    seen_tools = []
+    queue = [
+        [_tool_use("t1", "big")],
+        [_tool_use("t2", "big")],
+        [_tool_use("t3", "agent_recall", {"tool_use_id": "t1"})],
+        [_text("done")],
+    ]
+
+    def fake_chat(**kwargs):
+        seen_tools.append([t["name"] for t in kwargs["tools"]])
+        return SimpleNamespace(content=queue.pop(0))
+
+    monkeypatch.setattr(orchestrator, "chat", fake_chat)
+    settings = LLMSettings(history_max_chars=600, history_keep_turns=1)
+    result = orchestrator.run_agent("go", tool_registry=reg, settings=settings)
+
+    assert result.response == "done"
+    assert seen_tools[0] == ["big"]
+    assert seen_tools[2] == ["big", "agent_recall"]
+    assert result.turns[2].tool_results[0]["content"] == "z" * 500
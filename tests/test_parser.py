@@ -130,6 +130,55 @@ class TestParseTasks:
         assert reparsed[0].description == "Alpha"
         assert reparsed[1].done
 
+    def test_project_progress_follows_task_edits(self):
+        from adzekit.models import Project, ProjectState, Task
+
+        project = Project(
+            slug="p", state=ProjectState.ACTIVE, tasks=parse_tasks("- [ ] A\n- [x] B\n")
+        )
+        assert project.done_count == 1
+        assert project.progress == 0.5
+        project.tasks[0].done = True
+        assert project.progress == 1.0
+        project.tasks.append(Task("C"))
+        assert project.done_count == 2
+        project.tasks = []
+        assert project.done_count == 0
+        assert project.progress == 0.0
+
+    def test_parse_project_reuses_unchanged_files(self, tmp_path):
+        from adzekit.models import ProjectState
+        from adzekit.parser import parse_project
+
+        path = tmp_path / "demo.md"
+        path.write_text("# Demo\n\n## Log\n- [ ] One\n", encoding="utf-8")
+        first = parse_project(path, ProjectState.ACTIVE)
+        first.tasks[0].done = True
+        second = parse_project(path, ProjectState.ACTIVE)
+        assert second is not first
+        assert not second.tasks[0].done
+        assert parse_project(path, ProjectState.BACKLOG).state == ProjectState.BACKLOG
+
+        path.write_text("# Demo\n\n## Log\n- [x] One\n- [ ] Two\n", encoding="utf-8")
+        assert parse_project(path, ProjectState.ACTIVE).done_count == 1
+
+    def test_parse_cache_evicts_least_recently_used(self, tmp_path, monkeypatch):
+        from adzekit import parser
+
+        monkeypatch.setattr(parser, "_PARSE_CACHE", type(parser._PARSE_CACHE)())
+        monkeypatch.setattr(parser, "_PARSE_CACHE_MAX", 2)
+        paths = []
+        for name in ("a", "b", "c"):
+            path = tmp_path / f"{name}.md"
+            path.write_text(name, encoding="utf-8")
+            paths.append(path)
+
+        parser._load_or_parse(paths[0], lambda p: p.read_text())
+        parser._load_or_parse(paths[1], lambda p: p.read_text())
+        parser._load_or_parse(paths[0], lambda p: p.read_text())
+        parser._load_or_parse(paths[2], lambda p: p.read_text())
+        assert [k[0] for k in parser._PARSE_CACHE] == [paths[0], paths[2]]
+
 
 class TestParseDailyNote:
     def test_full_daily_note(self):
@@ -100,3 +100,15 @@ def test_generate_poc_finds_project_in_root_projects_dir(workspace):
     content = path.read_text()
     assert "# [POC] Root Project" in content
     assert "Direct placement." in content
+
+
+def test_render_poc_matches_str_format():
+    from adzekit.modules.poc import POC_TEMPLATE, _render_poc
+
+    fields = {
+        "title": "T",
+        "date_created": "2026-01-01",
+        "context": "Some {braces} here",
+        "tasks": "- [ ] one",
+    }
+    assert _render_poc(**fields) == POC_TEMPLATE.format(**fields)
@@ -0,0 +1,50 @@
+"""Tests for the agent LLM scheduler."""
+
+import asyncio
+
+from adzekit.agent import scheduler
+from adzekit.agent.scheduler import LLMScheduler, TokenBucket, estimate_tokens
+
+
+def test_estimate_tokens():
+    assert estimate_tokens("a" * 40, None, "b" * 8) == 12
+
+
+def test_token_bucket_waits_for_refill(monkeypatch):
+    clock = [0.0]
+    slept = []
+    monkeypatch.setattr(scheduler.time, "monotonic", lambda: clock[0])
+
+    async def fake_sleep(seconds):
+        slept.append(seconds)
+        clock[0] += seconds
+
+    monkeypatch.setattr(scheduler.asyncio, "sleep", fake_sleep)
+
+    async def main():
+        bucket = TokenBucket(tokens_per_minute=60)  # 1 token/second
+        await bucket.acquire(60)
+        await bucket.acquire(30)
+
+    asyncio.run(main())
+    assert slept == [30.0]
+
+
+def test_scheduler_caps_parallelism():
+    active = 0
+    peak = 0
+
+    async def job(sched):
+        nonlocal active, peak
+        async with sched.slot(1):
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    async def main():
+        sched = LLMScheduler(max_parallel=2, tokens_per_minute=1_000_000)
+        await asyncio.gather(*(job(sched) for _ in range(6)))
+
+    asyncio.run(main())
+    assert peak == 2
@@ -79,3 +79,74 @@ def test_shed_tools_read_only_backbone(shed_registry):
     # No tool should directly add loops to active.md
     assert "shed_add_loop" not in tool_names
     assert "shed_add_to_bench" not in tool_names
+
+
+def test_cached_load_reparses_only_on_change(workspace):
+    from adzekit.agent.shed_tools import _cached_load
+
+    path = workspace.loops_active
+    path.write_text("- [ ] first\n", encoding="utf-8")
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return path.read_text(encoding="utf-8")
+
+    assert _cached_load("t", [path], loader) == "- [ ] first\n"
+    assert _cached_load("t", [path], loader) == "- [ ] first\n"
+    assert len(calls) == 1
+
+    path.write_text("- [ ] first\n- [ ] second\n", encoding="utf-8")
+    assert "second" in _cached_load("t", [path], loader)
+    assert len(calls) == 2
+
+
+def test_slug_and_safe_names():
+    from adzekit.agent.shed_tools import _SAFE_NAME_RE, _slug
+
+    assert _slug("  Call Bob re: Q3 plan!  ") == "call-bob-re--q3-plan"
+    assert _slug("snake_case café") == "snake-case-café"
+    assert len(_slug("x" * 80)) == 50
+    assert _SAFE_NAME_RE.sub("-", "my notes/v1_final.md") == "my-notes-v1_final.md"
+
+
+def test_write_text_truncates_and_encodes(tmp_path):
+    from adzekit.agent.shed_tools import _write_text
+
+    path = tmp_path / "note.md"
+    path.write_text("a much longer previous body\n", encoding="utf-8")
+    _write_text(path, "café\n")
+    assert path.read_text(encoding="utf-8") == "café\n"
+
+
+def test_write_text_keeps_mode_and_honours_umask(tmp_path):
+    import os
+
+    from adzekit.agent.shed_tools import _write_text
+
+    existing = tmp_path / "private.md"
+    existing.write_text("old", encoding="utf-8")
+    existing.chmod(0o600)
+    _write_text(existing, "new")
+    assert existing.stat().st_mode & 0o777 == 0o600
+
+    old_umask = os.umask(0o002)
+    try:
+        _write_text(tmp_path / "fresh.md", "x")
+    finally:
+        os.umask(old_umask)
+    assert (tmp_path / "fresh.md").stat().st_mode & 0o777 == 0o664
+
+
+def test_write_recreates_removed_drafts_dir(workspace, monkeypatch):
+    import shutil
+
+    from adzekit.agent import shed_tools
+
+    monkeypatch.setenv("ADZEKIT_SHED", str(workspace.shed))
+    init_shed(workspace)
+
+    shed_tools.shed_save_summary("one", "1")
+    shutil.rmtree(workspace.drafts_dir)
+    shed_tools.shed_save_summary("two", "2")
+    assert (workspace.drafts_dir / "two.md").read_text(encoding="utf-8") == "2"
@@ -1,6 +1,7 @@
 """Tests for the tags module."""
 
 import json
+import os
 
 from adzekit.modules.tags import (
     all_tags,
@@ -66,6 +67,67 @@ def test_tag_index_excludes_stock(workspace):
     assert "secret-tag" not in idx
 
 
+def test_tag_index_excludes_drafts(workspace):
+    init_shed(workspace)
+    draft = workspace.drafts_dir / "nested" / "draft.md"
+    draft.parent.mkdir(parents=True, exist_ok=True)
+    draft.write_text("#draft-only", encoding="utf-8")
+
+    idx = tag_index(workspace)
+    assert "draft-only" not in idx
+
+
+def test_tag_index_reuses_unchanged_files(workspace, monkeypatch):
+    init_shed(workspace)
+    note = workspace.knowledge_dir / "cached.md"
+    note.write_text("#alpha", encoding="utf-8")
+    assert "alpha" in tag_index(workspace)
+
+    from adzekit.modules import tags
+
+    calls = []
+    real = tags.extract_tags
+    monkeypatch.setattr(tags, "extract_tags", lambda text: calls.append(1) or real(text))
+    assert "alpha" in tag_index(workspace)
+    assert calls == []
+
+    note.write_text("#beta and more", encoding="utf-8")
+    idx = tag_index(workspace)
+    assert "beta" in idx and "alpha" not in idx
+
+    tags._INDEX_CACHE.clear()
+    calls.clear()
+    tag_index(workspace)
+    assert calls
+
+
+def test_tag_index_reads_many_changed_files(workspace):
+    init_shed(workspace)
+    for i in range(20):
+        note = workspace.knowledge_dir / f"bulk-{i:02d}.md"
+        note.write_text(f"#bulk and #n{i}", encoding="utf-8")
+
+    idx = tag_index(workspace)
+    assert len(idx["bulk"]) == 20
+    assert idx["bulk"] == sorted(idx["bulk"])
+    assert idx["n7"] == [workspace.knowledge_dir / "bulk-07.md"]
+
+
+def test_tag_index_sees_loop_writes(workspace):
+    from datetime import date
+
+    from adzekit.models import Loop
+    from adzekit.modules.loops import add_loop
+
+    init_shed(workspace)
+    assert "fresh" not in tag_index(workspace)
+    add_loop(
+        Loop(date=date.today(), title="Reply #fresh", who="Al", what="x", status="Open"),
+        workspace,
+    )
+    assert "fresh" in tag_index(workspace)
+
+
 def test_files_for_tag(workspace):
     init_shed(workspace)
     files = files_for_tag("example", workspace)
@@ -117,6 +179,16 @@ def test_generate_cursor_snippets(workspace):
         assert snippet["scope"] == "markdown"
 
 
+def test_generate_cursor_snippets_skips_identical_write(workspace):
+    init_shed(workspace)
+    path = generate_cursor_snippets(workspace)
+    before = path.stat().st_mtime_ns
+    os.utime(path, ns=(before - 10**9, before - 10**9))
+
+    generate_cursor_snippets(workspace)
+    assert path.stat().st_mtime_ns == before - 10**9
+
+
 def test_project_tags_indexed(workspace):
     create_project("tagged-proj", title="Tagged #consulting", settings=workspace)
     idx = tag_index(workspace)
@@ -1,8 +1,9 @@
 """Tests for the agent tool registry."""
 
 import json
+from datetime import date
 
-from adzekit.agent.tools import ToolRegistry
+from adzekit.agent.tools import ToolRegistry, dumps, tool_result_content
 
 
 def test_register_and_list():
@@ -47,7 +48,7 @@ def test_call_tool():
     assert result == "7"
 
 
-def test_call_returns_dict_as_json():
+def test_call_returns_dict_unserialized():
     reg = ToolRegistry()
 
     @reg.register
@@ -56,17 +57,20 @@ def test_call_returns_dict_as_json():
         return {"status": "ok", "count": 42}
 
     result = reg.call("info", {})
-    parsed = json.loads(result)
-    assert parsed["status"] == "ok"
-    assert parsed["count"] == 42
+    assert result == {"status": "ok", "count": 42}
+
+
+def test_tool_result_content_serializes_once():
+    assert tool_result_content("already text") == "already text"
+    parsed = json.loads(tool_result_content({"status": "ok", "count": 42}))
+    assert parsed == {"status": "ok", "count": 42}
 
 
 def test_call_unknown_tool():
     reg = ToolRegistry()
     result = reg.call("nonexistent", {})
-    parsed = json.loads(result)
-    assert "error" in parsed
-    assert "Unknown tool" in parsed["error"]
+    assert "error" in result
+    assert "Unknown tool" in result["error"]
 
 
 def test_call_handles_exception():
@@ -78,9 +82,8 @@ def test_call_handles_exception():
         raise ValueError("broken")
 
     result = reg.call("fail", {})
-    parsed = json.loads(result)
-    assert "error" in parsed
-    assert "ValueError" in parsed["error"]
+    assert "error" in result
+    assert "ValueError" in result["error"]
 
 
 def test_to_anthropic_tools():
@@ -119,3 +122,55 @@ def test_to_anthropic_schema_types():
     assert props["count"]["type"] == "integer"
     assert props["ratio"]["type"] == "number"
     assert props["flag"]["type"] == "boolean"
+
+
+def test_to_anthropic_tools_cached_until_register():
+    reg = ToolRegistry()
+
+    @reg.register
+    def one() -> str:
+        """First."""
+        return "1"
+
+    first = reg.to_anthropic_tools()
+    assert reg.to_anthropic_tools() is first
+
+    @reg.register
+    def two() -> str:
+        """Second."""
+        return "2"
+
+    assert [t["name"] for t in reg.to_anthropic_tools()] == ["one", "two"]
+
+
+def test_register_resolves_string_annotations():
+    reg = ToolRegistry()
+
+    def later(count: "int", names: "list[str]") -> "str":
+        return "ok"
+
+    reg.register(later)
+    props = reg.to_anthropic_tools()[0]["input_schema"]["properties"]
+    assert props["count"]["type"] == "integer"
+    assert props["names"]["type"] == "array"
+
+
+def test_dumps_renders_dates_as_iso():
+    assert json.loads(dumps({"due": date(2026, 3, 1), "n": None})) == {
+        "due": "2026-03-01", "n": None,
+    }
+
+
+def test_dumps_matches_stdlib_json():
+    obj = {"title": "Café", "ratio": 0.1, 1: "int key"}
+    assert dumps(obj) == json.dumps(obj)
+
+
+def test_python_type_to_json_mapping():
+    from adzekit.agent.tools import _python_type_to_json
+
+    assert _python_type_to_json(int) == "integer"
+    assert _python_type_to_json(bool) == "boolean"
+    assert _python_type_to_json(dict[str, int]) == "object"
+    assert _python_type_to_json(list[str]) == "array"
+    assert _python_type_to_json(date) == "string"
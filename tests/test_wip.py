@@ -65,3 +65,18 @@ def test_wip_status_summary(workspace):
     assert status["active_projects"] == 1
     assert status["max_active_projects"] == 3
     assert status["projects_available"] == 2
+
+
+def test_archive_falls_back_across_filesystems(workspace, monkeypatch):
+    import errno
+    import os
+
+    create_project("moved", backlog=False, settings=workspace)
+
+    def cross_device(src, dst):
+        raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+    monkeypatch.setattr(os, "replace", cross_device)
+    archive_project("moved", workspace)
+    assert (workspace.archive_dir / "moved.md").exists()
+    assert not (workspace.active_dir / "moved.md").exists()
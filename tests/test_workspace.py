@@ -26,6 +26,91 @@ def test_init_shed_seeds_files(workspace):
     assert "Bench" in workspace.bench_path.read_text()
 
 
+def test_derived_paths_are_built_once(workspace):
+    assert workspace.loops_active is workspace.loops_active
+    assert workspace.loops_active == workspace.shed / "loops" / "active.md"
+    assert "loops_dir" not in workspace.model_dump()
+
+
+def test_ensure_shed_keeps_existing_files(workspace):
+    workspace.bench_path.write_text("# Bench\n\n- keep me\n", encoding="utf-8")
+    workspace.ensure_shed()
+    assert workspace.bench_path.read_text(encoding="utf-8") == "# Bench\n\n- keep me\n"
+    assert workspace.projects_dir.is_dir()
+    assert workspace.loops_backlog.read_text(encoding="utf-8") == ""
+
+
+def test_ensure_shed_appends_missing_gitignore_entries(tmp_path):
+    from adzekit.config import Settings
+
+    gitignore = tmp_path / ".gitignore"
+    gitignore.write_text("*.pyc\ndrafts/", encoding="utf-8")
+    settings = Settings(shed=tmp_path)
+    settings.ensure_shed()
+    assert gitignore.read_text(encoding="utf-8") == "*.pyc\ndrafts/\nstock/\n"
+
+    gitignore.write_text("", encoding="utf-8")
+    settings.ensure_shed()  # already checked in this process
+    assert gitignore.read_text(encoding="utf-8") == ""
+
+
+def test_ensure_shed_reruns_when_the_shed_is_gone(tmp_path):
+    import shutil
+
+    from adzekit.config import Settings
+
+    settings = Settings(shed=tmp_path / "shed")
+    settings.ensure_shed()
+    shutil.rmtree(settings.shed)
+    settings.ensure_shed()
+    assert settings.loops_active.exists()
+    assert settings.drafts_dir.is_dir()
+
+
+def test_marker_parse_is_cached_until_the_file_changes(workspace):
+    from adzekit.config import _MARKER_CACHE, Settings
+
+    assert workspace.max_active_projects == 3
+    assert workspace.marker_path in _MARKER_CACHE
+
+    workspace.set_config("max_active_projects", "5")
+    assert workspace.max_active_projects == 5
+
+    text = workspace.marker_path.read_text(encoding="utf-8")
+    workspace.marker_path.write_text(
+        text.replace("max_active_projects = 5", "max_active_projects = 12"), encoding="utf-8"
+    )
+    # A held instance re-reads the marker once its stat changes.
+    assert workspace.max_active_projects == 12
+    assert Settings(shed=workspace.shed).max_active_projects == 12
+
+
+def test_marker_rewrite_is_atomic_and_seeds_cache(workspace):
+    from adzekit.config import _MARKER_CACHE, _parse_kv_file
+
+    workspace.set_config("rclone_remote", "gdrive:x")
+    assert _MARKER_CACHE[workspace.marker_path][2]["rclone_remote"] == "gdrive:x"
+    assert _parse_kv_file(workspace.marker_path)["rclone_remote"] == "gdrive:x"
+    assert workspace.marker_path.stat().st_mode & 0o777 == 0o644
+    assert [p.name for p in workspace.shed.glob(".adzekit.*")] == []
+
+
+def test_marker_rewrite_keeps_symlink_and_mode(workspace, tmp_path):
+    from adzekit.config import _parse_kv_file
+
+    dotfile = tmp_path / "dotfiles" / "adzekit-marker"
+    dotfile.parent.mkdir()
+    dotfile.write_text(workspace.marker_path.read_text(encoding="utf-8"), encoding="utf-8")
+    dotfile.chmod(0o600)
+    workspace.marker_path.unlink()
+    workspace.marker_path.symlink_to(dotfile)
+
+    workspace.set_config("rclone_remote", "gdrive:y")
+    assert workspace.marker_path.is_symlink()
+    assert _parse_kv_file(dotfile)["rclone_remote"] == "gdrive:y"
+    assert dotfile.stat().st_mode & 0o777 == 0o600
+
+
 def test_create_daily_note(workspace):
     today = date.today()
     path = create_daily_note(today, workspace)
@@ -316,3 +401,18 @@ def test_write_marker_preserves_custom_values(tmp_path):
 def test_active_dir_is_projects_root(workspace):
     """Active projects should live at projects/ root, not projects/active/."""
     assert workspace.active_dir == workspace.projects_dir
+
+
+def test_env_overrides_skip_marker_values(workspace, monkeypatch):
+    from adzekit.config import Settings
+
+    workspace.set_config("rclone_remote", "gdrive:marker")
+    workspace.set_config("agent_timeout", "42")
+    assert Settings(shed=workspace.shed).rclone_remote == "gdrive:marker"
+    assert Settings(shed=workspace.shed).agent_timeout == 42
+
+    for env in ("RCLONE_REMOTE", "GIT_REPO", "GIT_BRANCH", "AGENT_BACKEND", "AGENT_TIMEOUT"):
+        monkeypatch.setenv(f"ADZEKIT_{env}", "7" if env == "AGENT_TIMEOUT" else "x")
+    settings = Settings(shed=workspace.shed)
+    assert settings.rclone_remote == "x"
+    assert settings.agent_timeout == 7